@@ -1,102 +1,232 @@
 from duckduckgo_search import DDGS
 import trafilatura
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import aiohttp
+from lxml import etree, html as lxml_html
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import urlparse
 import time
+from functools import lru_cache
+from collections import defaultdict
 
 try:
-    from playwright.sync_api import sync_playwright
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+try:
+    import aiodns  # noqa: F401 (enables aiohttp.AsyncResolver)
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+# The aiohttp connector caches resolutions, so repeated scrapes of the same host
+# skip the lookup for DNS_CACHE_TTL seconds.
+DNS_CACHE_TTL = 300
+
+# One keep-alive connection pool shared by every synchronous request
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=20, pool_maxsize=50,
+                       max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]))
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+@lru_cache(maxsize=2048)
 def get_domain(url):
     return urlparse(url).netloc.lower().replace('www.', '')
 
 def extract_body_content(html):
-    soup = BeautifulSoup(html, "lxml")
-    body = soup.body
-    return body.get_text(separator="\n", strip=True) if body else ""
+    tree = LexborHTMLParser(html)
+    body = tree.body
+    if not body:
+        return ""
+    for node in body.css("script, style"):
+        node.decompose()
+    return body.text(separator="\n", strip=True, skip_empty=True)
+
+# Pages arrive as decoded str; feed lxml UTF-8 bytes so a leftover <meta charset> can't mis-decode them
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+# Compiled once; each call then runs straight against the parsed tree
+_AMZ_TITLE = etree.XPath('string(//*[@id="productTitle"])')
+_AMZ_FEATURES = etree.XPath('//*[@id="feature-bullets"]//ul//li//span')
+_AMZ_DESCRIPTION = etree.XPath('//*[@id="productDescription"]')
+_AMZ_SPEC_ROWS = etree.XPath('//*[@id="productDetails_techSpec_section_1" or @id="productDetails_detailBullets_sections1"]'
+                             '//tr[.//th and .//td]')
+_AMZ_ROW_TH = etree.XPath('(.//th)[1]')
+_AMZ_ROW_TD = etree.XPath('(.//td)[1]')
+
+def _node_text(node):
+    # Same result as BeautifulSoup's get_text(strip=True)
+    return "".join(t.strip() for t in node.itertext())
 
 def extract_amazon_details(html):
-    soup = BeautifulSoup(html, "lxml")
+    if isinstance(html, str):
+        html = html.encode("utf-8", errors="replace")
+    try:
+        tree = lxml_html.fromstring(html, parser=_UTF8_HTML_PARSER)
+    except (etree.ParserError, ValueError):
+        return {}
     result = {}
-    title = soup.find(id="productTitle")
+    title = _AMZ_TITLE(tree).strip()
     if title:
-        result["title"] = title.get_text(strip=True)
-    bullets = soup.select("#feature-bullets ul li span")
-    if bullets:
-        result["features"] = [b.get_text(strip=True) for b in bullets if b.get_text(strip=True)]
-    desc = soup.find(id="productDescription")
+        result["title"] = title
+    features = [f for f in map(_node_text, _AMZ_FEATURES(tree)) if f]
+    if features:
+        result["features"] = features
+    desc = _AMZ_DESCRIPTION(tree)
     if desc:
-        result["description"] = desc.get_text(strip=True)
-    specs = {}
-    for table_id in ["productDetails_techSpec_section_1", "productDetails_detailBullets_sections1"]:
-        table = soup.find(id=table_id)
-        if table:
-            for row in table.find_all("tr"):
-                th = row.find("th")
-                td = row.find("td")
-                if th and td:
-                    specs[th.get_text(strip=True)] = td.get_text(strip=True)
+        result["description"] = _node_text(desc[0])
+    specs = {_node_text(_AMZ_ROW_TH(row)[0]): _node_text(_AMZ_ROW_TD(row)[0]) for row in _AMZ_SPEC_ROWS(tree)}
     if specs:
         result["specs"] = specs
     return result
 
+def scrape_html(url, html):
+    """
+    Runs the trafilatura / bs4 / Amazon extractors over already downloaded HTML.
+    Returns a dict with url, method and content keys, or None if nothing usable was found.
+    """
+    extracted = trafilatura.extract(html, url=url, include_comments=False, favor_recall=True)
+    if extracted and len(extracted.strip()) > 30 and 'continue shopping' not in extracted.lower():
+        return {"url": url, "method": "trafilatura", "content": extracted}
+    body = extract_body_content(html)
+    if body and len(body.strip()) > 30 and 'continue shopping' not in body.lower():
+        # If Amazon, extract structured info
+        if "amazon." in url:
+            details = extract_amazon_details(html)
+            if details:
+                return {"url": url, "method": "bs4+amazon", "content": details}
+        return {"url": url, "method": "bs4", "content": body}
+    return None
+
 def try_scrape(url):
-    # Try trafilatura
-    downloaded = trafilatura.fetch_url(url)
-    if downloaded:
-        extracted = trafilatura.extract(downloaded)
-        if extracted and len(extracted.strip()) > 30 and 'continue shopping' not in extracted.lower():
-            return {"url": url, "method": "trafilatura", "content": extracted}
-    # Try requests + bs4 body
+    # Download once; trafilatura, bs4 body and Amazon extraction all work from the same HTML
     try:
-        resp = requests.get(url, timeout=15, headers={"User-Agent": "Mozilla/5.0"})
+        resp = _SESSION.get(url, timeout=15, headers={"User-Agent": "Mozilla/5.0"})
         if resp.ok:
-            body = extract_body_content(resp.text)
-            if body and len(body.strip()) > 30 and 'continue shopping' not in body.lower():
-                # If Amazon, extract structured info
-                if "amazon." in url:
-                    details = extract_amazon_details(resp.text)
-                    if details:
-                        return {"url": url, "method": "bs4+amazon", "content": details}
-                return {"url": url, "method": "bs4", "content": body}
+            return scrape_html(url, resp.text)
     except Exception:
         pass
     # Can't scrape normally
     return None
 
-def try_playwright_scrape(url):
-    if not PLAYWRIGHT_AVAILABLE:
-        print(f"Playwright not installed. Can't scrape JS-heavy site: {url}")
-        return None
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+async def _playwright_scrape_one(browser, url):
+    # A fresh context per URL keeps cookies/storage isolated while sharing the browser process
+    context = None
+    try:
+        context = await browser.new_context()
+        page = await context.new_page()
+        await page.goto(url, wait_until="domcontentloaded", timeout=25000)
+        # Wait only as long as the page is actually busy; a page that never goes quiet is scraped as-is
         try:
-            page.goto(url, timeout=25000)
-            time.sleep(4)
-            html = page.content()
             if "amazon." in url:
-                details = extract_amazon_details(html)
-                if details:
-                    return {"url": url, "method": "playwright+amazon", "content": details}
+                await page.wait_for_selector("#productTitle, #feature-bullets", timeout=10000)
             else:
-                body = extract_body_content(html)
-                if body and len(body.strip()) > 30:
-                    return {"url": url, "method": "playwright", "content": body}
-        except Exception as e:
-            print(f"Playwright error: {e}")
-        finally:
-            browser.close()
+                await page.wait_for_load_state("networkidle", timeout=10000)
+        except PlaywrightTimeoutError:
+            pass
+        html = await page.content()
+        if "amazon." in url:
+            details = extract_amazon_details(html)
+            if details:
+                return {"url": url, "method": "playwright+amazon", "content": details}
+        else:
+            body = extract_body_content(html)
+            if body and len(body.strip()) > 30:
+                return {"url": url, "method": "playwright", "content": body}
+    except Exception as e:
+        print(f"Playwright error: {e}")
+    finally:
+        if context:
+            await context.close()
     return None
 
-def scrape_top_sites(query, max_results=10):
+async def playwright_scrape_many(urls, max_results=None):
     """
-    Scrapes up to 2 unique top sites for the given search query, using Playwright only if necessary.
-    Returns a list of dictionaries with url, method, and content keys.
+    Renders all urls in parallel pages of a single Chromium instance.
+    Returns one result (or None) per url, in input order. Once max_results pages have
+    been scraped the renders still running are cancelled and their urls left as None.
+    """
+    results = [None] * len(urls)
+    if not PLAYWRIGHT_AVAILABLE:
+        for url in urls:
+            print(f"Playwright not installed. Can't scrape JS-heavy site: {url}")
+        return results
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        
+        async def render(index, url):
+            return index, await _playwright_scrape_one(browser, url)
+        
+        tasks = [asyncio.create_task(render(index, url)) for index, url in enumerate(urls)]
+        try:
+            scraped = 0
+            for next_done in asyncio.as_completed(tasks):
+                index, result = await next_done
+                results[index] = result
+                if result:
+                    scraped += 1
+                    if max_results and scraped >= max_results:
+                        break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await browser.close()
+    return results
+
+def try_playwright_scrape(url):
+    return asyncio.run(playwright_scrape_many([url]))[0]
+
+# Concurrent fetches: unrelated domains run in parallel, the same domain at most
+# PER_DOMAIN_LIMIT at a time and no more often than every DOMAIN_MIN_WAIT seconds
+GLOBAL_FETCH_LIMIT = 20
+PER_DOMAIN_LIMIT = 1
+DOMAIN_MIN_WAIT = 1.0
+
+def _make_connector():
+    resolver = aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None
+    return aiohttp.TCPConnector(limit=GLOBAL_FETCH_LIMIT, resolver=resolver, use_dns_cache=True, ttl_dns_cache=DNS_CACHE_TTL)
+
+class _NotHTMLError(ValueError):
+    """The response is a PDF, image or other non-HTML file; rendering it in a browser won't help either"""
+
+async def _fetch(session, url):
+    async with session.get(url, headers={"User-Agent": "Mozilla/5.0"},
+                           timeout=aiohttp.ClientTimeout(total=15)) as resp:
+        resp.raise_for_status()
+        # Only the headers have been read so far: skip PDFs, images etc. without downloading them
+        if "Content-Type" in resp.headers and "html" not in resp.content_type:
+            raise _NotHTMLError(f"Not an HTML page ({resp.content_type})")
+        return url, await resp.text()
+
+async def _fetch_all(session, urls):
+    global_sem = asyncio.Semaphore(GLOBAL_FETCH_LIMIT)
+    domain_sems = defaultdict(lambda: asyncio.Semaphore(PER_DOMAIN_LIMIT))
+    last_fetch = {}
+
+    async def fetch(url):
+        domain = get_domain(url)
+        async with domain_sems[domain]:
+            if domain in last_fetch:
+                await asyncio.sleep(max(0, DOMAIN_MIN_WAIT - (time.monotonic() - last_fetch[domain])))
+            try:
+                async with global_sem:
+                    return await _fetch(session, url)
+            finally:
+                last_fetch[domain] = time.monotonic()
+
+    return await asyncio.gather(*[fetch(url) for url in urls], return_exceptions=True)
+
+async def scrape_top_sites_async(query, max_results=10):
+    """
+    Async version of scrape_top_sites: the top 5 unique domains are fetched concurrently,
+    then parsed in rank order until 2 sites have been scraped.
     """
     # Get search results
     with DDGS() as ddgs:
@@ -109,38 +239,45 @@ def scrape_top_sites(query, max_results=10):
         if domain not in seen_domains:
             filtered_results.append(result['href'])
             seen_domains.add(domain)
-    # Try scraping the top 2 sites
+    # Fetch the top 5 unique domains at once
+    candidates = filtered_results[:5]
+    async with aiohttp.ClientSession(connector=_make_connector()) as session:
+        pages = await _fetch_all(session, candidates)
+    # Keep the first 2 that scrape normally, in search rank order
     normal_scraped = []
+    scraped_domains = set()
     failed_js_needed = []
-    for url in filtered_results[:2]:
-        scraped = try_scrape(url)
-        if scraped:
-            normal_scraped.append(scraped)
-        else:
-            failed_js_needed.append(url)
+    for url, page in zip(candidates, pages):
         if len(normal_scraped) == 2:
             break
-    # If less than 2, try more up to top 5 unique domains
-    i = 2
-    while len(normal_scraped) < 2 and i < min(len(filtered_results), 5):
-        url = filtered_results[i]
-        scraped = try_scrape(url)
-        if scraped and get_domain(url) not in [get_domain(x['url']) for x in normal_scraped]:
+        domain = get_domain(url)
+        # Check the domain first so pages from an already scraped site are never parsed
+        scraped = None
+        if domain not in scraped_domains and not isinstance(page, Exception):
+            scraped = scrape_html(url, page[1])
+        if scraped:
             normal_scraped.append(scraped)
-        else:
+            scraped_domains.add(domain)
+        elif not isinstance(page, _NotHTMLError):
             failed_js_needed.append(url)
-        i += 1
     # If still less than 2, try Playwright *only for the URLs that failed and not already done*
     if len(normal_scraped) < 2 and PLAYWRIGHT_AVAILABLE:
-        for url in failed_js_needed:
-            if get_domain(url) not in [get_domain(x['url']) for x in normal_scraped]:
-                scraped = try_playwright_scrape(url)
-                if scraped:
-                    normal_scraped.append(scraped)
-                if len(normal_scraped) == 2:
-                    break
+        pending = [url for url in failed_js_needed if get_domain(url) not in scraped_domains]
+        for url, scraped in zip(pending, await playwright_scrape_many(pending, 2 - len(normal_scraped))):
+            if scraped:
+                normal_scraped.append(scraped)
+                scraped_domains.add(get_domain(url))
+            if len(normal_scraped) == 2:
+                break
     return normal_scraped
 
+def scrape_top_sites(query, max_results=10):
+    """
+    Scrapes up to 2 unique top sites for the given search query, using Playwright only if necessary.
+    Returns a list of dictionaries with url, method, and content keys.
+    """
+    return asyncio.run(scrape_top_sites_async(query, max_results))
+
 if __name__ == "__main__":
     query = input("Enter your search query: ").strip()
     results = scrape_top_sites(query)
@@ -2,14 +2,45 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pytrends.request import TrendReq
+import pytrends.request as pytrends_request
 import requests
 from bs4 import BeautifulSoup
 import time
 import json
+import concurrent.futures
+import threading
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import requests_cache
+    from types import SimpleNamespace
+    # pytrends opens a new session through requests.session() for every call; hand pytrends alone a
+    # requests namespace whose session() is cached, so repeated (keyword, timeframe, geo) lookups skip
+    # the network while every other requests call in the process stays untouched
+    _PYTRENDS_CACHE = requests_cache.SQLiteCache('pytrends_cache')
+    
+    def _cached_pytrends_session():
+        return requests_cache.CachedSession(backend=_PYTRENDS_CACHE, expire_after=3600,
+                                            allowable_codes=(200,), allowable_methods=('GET', 'POST'))
+    
+    pytrends_request.requests = SimpleNamespace(**{**vars(requests), 'session': _cached_pytrends_session})
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+    from types import SimpleNamespace
+    # pytrends decodes every response with json.loads; route that through orjson
+    # (payload encoding stays on json.dumps, which pytrends needs as str)
+    pytrends_request.json = SimpleNamespace(loads=orjson.loads, dumps=json.dumps)
+except ImportError:
+    orjson = None
+
+# Parallel Google Trends clients in seasonal_analysis; each costs a cookie request on creation
+SEASONAL_WORKERS = 3
+
 class GoogleTrendsSearchAnalyzer:
     def __init__(self):
         # Initialize Google Trends
@@ -68,6 +99,27 @@ class GoogleTrendsSearchAnalyzer:
             print(f"Error getting related queries: {e}")
             return {'rising': None, 'top': None}
     
+    def get_related_queries_batch(self, keywords, timeframe='today 12-m', geo='US'):
+        """
+        Get related queries for several keywords, 5 per request (the pytrends payload limit)
+        """
+        related_data = {}
+        for start in range(0, len(keywords), 5):
+            batch = keywords[start:start + 5]
+            try:
+                self.pytrends.build_payload(batch, timeframe=timeframe, geo=geo)
+                related_queries = self.pytrends.related_queries()
+                for keyword in batch:
+                    related_data[keyword] = {
+                        'rising': related_queries[keyword]['rising'],
+                        'top': related_queries[keyword]['top']
+                    }
+            except Exception as e:
+                print(f"Error getting related queries: {e}")
+                for keyword in batch:
+                    related_data[keyword] = {'rising': None, 'top': None}
+        return related_data
+    
     def get_interest_by_region(self, keyword, timeframe='today 12-m', geo='US'):
         """
         Get interest by region/location
@@ -85,6 +137,7 @@ class GoogleTrendsSearchAnalyzer:
         Get keyword suggestions
         """
         try:
+            # suggestions() doesn't touch the built payload, so it can share the client with a running report
             suggestions = self.pytrends.suggestions(keyword=keyword)
             return [item['title'] for item in suggestions]
         except Exception as e:
@@ -107,6 +160,75 @@ class GoogleTrendsSearchAnalyzer:
             print(f"Error comparing keywords: {e}")
             return pd.DataFrame()
     
+    def _bulk_keyword_report(self, keyword, timeframe='today 12-m', geo='US'):
+        """
+        Interest over time, related queries and interest by region for one keyword
+        from a single build_payload (pytrends keeps the payload on the instance)
+        """
+        try:
+            self.pytrends.build_payload([keyword], cat=0, timeframe=timeframe, geo=geo, gprop='')
+        except Exception as e:
+            print(f"Error building payload: {e}")
+            return pd.DataFrame(), {'rising': None, 'top': None}, pd.DataFrame()
+        
+        def fetch_interest():
+            try:
+                interest_df = self.pytrends.interest_over_time()
+                if 'isPartial' in interest_df.columns:
+                    interest_df = interest_df.drop('isPartial', axis=1)
+                return interest_df
+            except Exception as e:
+                print(f"Error getting interest over time: {e}")
+                return pd.DataFrame()
+        
+        def fetch_related():
+            try:
+                related_queries = self.pytrends.related_queries()
+                return {
+                    'rising': related_queries[keyword]['rising'],
+                    'top': related_queries[keyword]['top']
+                }
+            except Exception as e:
+                print(f"Error getting related queries: {e}")
+                return {'rising': None, 'top': None}
+        
+        def fetch_region():
+            try:
+                region_df = self.pytrends.interest_by_region(resolution='COUNTRY', inc_low_vol=True, inc_geo_code=False)
+                return region_df.sort_values(by=keyword, ascending=False)
+            except Exception as e:
+                print(f"Error getting interest by region: {e}")
+                return pd.DataFrame()
+        
+        # The three widgets only read the built payload, so they can be fetched concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(fetch) for fetch in (fetch_interest, fetch_related, fetch_region)]
+        return tuple(future.result() for future in futures)
+    
+    def _compare_with_related(self, keywords, timeframe='today 12-m', geo='US'):
+        """
+        compare_keywords + get_related_queries_batch sharing one build_payload (up to 5 keywords)
+        """
+        try:
+            self.pytrends.build_payload(keywords, timeframe=timeframe, geo=geo)
+            comparison_df = self.pytrends.interest_over_time()
+            if 'isPartial' in comparison_df.columns:
+                comparison_df = comparison_df.drop('isPartial', axis=1)
+        except Exception as e:
+            print(f"Error comparing keywords: {e}")
+            return pd.DataFrame(), self.get_related_queries_batch(keywords, timeframe, geo)
+        
+        try:
+            related_queries = self.pytrends.related_queries()
+            related_data = {
+                keyword: {'rising': related_queries[keyword]['rising'], 'top': related_queries[keyword]['top']}
+                for keyword in keywords
+            }
+        except Exception as e:
+            print(f"Error getting related queries: {e}")
+            related_data = {keyword: {'rising': None, 'top': None} for keyword in keywords}
+        return comparison_df, related_data
+    
     def plot_trends(self, df, title="Google Trends Analysis"):
         """
         Plot trends data
@@ -135,21 +257,14 @@ class GoogleTrendsSearchAnalyzer:
         print(f"🔍 Comprehensive Analysis for: '{keyword}'")
         print("=" * 50)
         
-        # 1. Interest over time
-        print("📈 Getting interest over time...")
-        interest_df = self.get_interest_over_time([keyword], timeframe, geo)
-        
-        # 2. Related queries
-        print("🔗 Getting related queries...")
-        related = self.get_related_queries(keyword, timeframe, geo)
-        
-        # 3. Interest by region
-        print("🌍 Getting interest by region...")
-        region_df = self.get_interest_by_region(keyword, timeframe, geo)
-        
-        # 4. Suggestions
+        # 1-3. Interest over time, related queries and interest by region share one payload
+        # 4. Suggestions come from a separate endpoint and run alongside
+        print("📈 Getting interest over time, related queries and interest by region...")
         print("💡 Getting keyword suggestions...")
-        suggestions = self.get_suggestions(keyword)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            suggestions_future = executor.submit(self.get_suggestions, keyword)
+            interest_df, related, region_df = self._bulk_keyword_report(keyword, timeframe, geo)
+            suggestions = suggestions_future.result()
         
         # Compile results
         analysis = {
@@ -170,36 +285,75 @@ class GoogleTrendsSearchAnalyzer:
         
         return analysis
     
+    @staticmethod
+    def _excel_value(value):
+        """
+        Convert a pandas/numpy cell into something xlsxwriter can write directly
+        """
+        if isinstance(value, (list, tuple)):
+            return ', '.join(str(v) for v in value)
+        if pd.isna(value):
+            return None
+        if isinstance(value, pd.Timestamp):
+            return value.to_pydatetime()
+        return value.item() if hasattr(value, 'item') else value
+    
+    def _write_sheet(self, workbook, sheet_name, header, rows, date_format):
+        """
+        Write a sheet strictly row by row, as xlsxwriter's constant_memory mode requires
+        """
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, header)
+        for row_num, row in enumerate(rows, 1):
+            for col_num, value in enumerate(row):
+                value = self._excel_value(value)
+                if isinstance(value, datetime):
+                    worksheet.write_datetime(row_num, col_num, value, date_format)
+                elif value is not None:
+                    worksheet.write(row_num, col_num, value)
+    
+    def _write_frame(self, workbook, sheet_name, df, date_format, index=True):
+        header = ([df.index.name or ''] if index else []) + [str(column) for column in df.columns]
+        self._write_sheet(workbook, sheet_name, header, df.itertuples(index=index, name=None), date_format)
+    
     def export_analysis(self, analysis, filename=None):
         """
         Export analysis to Excel file
+        Rows are streamed to disk (xlsxwriter constant_memory) instead of building the workbook in memory
         """
         if not filename:
             filename = f"google_trends_analysis_{analysis['keyword']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         
         try:
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+            with pd.ExcelWriter(filename, engine='xlsxwriter',
+                                engine_kwargs={'options': {'constant_memory': True}}) as writer:
+                # pandas' to_excel writes column by column, which constant_memory mode would drop,
+                # so the sheets are written row by row straight through the workbook
+                workbook = writer.book
+                date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+                
                 # Interest over time
                 if not analysis['interest_over_time'].empty:
-                    analysis['interest_over_time'].to_excel(writer, sheet_name='Interest_Over_Time')
+                    self._write_frame(workbook, 'Interest_Over_Time', analysis['interest_over_time'], date_format)
                 
                 # Related queries
                 if analysis['related_queries']['top'] is not None:
-                    analysis['related_queries']['top'].to_excel(writer, sheet_name='Related_Top')
+                    self._write_frame(workbook, 'Related_Top', analysis['related_queries']['top'], date_format)
                 if analysis['related_queries']['rising'] is not None:
-                    analysis['related_queries']['rising'].to_excel(writer, sheet_name='Related_Rising')
+                    self._write_frame(workbook, 'Related_Rising', analysis['related_queries']['rising'], date_format)
                 
                 # Interest by region
                 if not analysis['interest_by_region'].empty:
-                    analysis['interest_by_region'].to_excel(writer, sheet_name='Interest_By_Region')
+                    self._write_frame(workbook, 'Interest_By_Region', analysis['interest_by_region'], date_format)
                 
                 # Suggestions
                 if analysis['suggestions']:
-                    pd.DataFrame(analysis['suggestions'], columns=['Suggestions']).to_excel(writer, sheet_name='Suggestions')
+                    self._write_sheet(workbook, 'Suggestions', ['', 'Suggestions'],
+                                      enumerate(analysis['suggestions']), date_format)
                 
                 # Summary
-                summary_df = pd.DataFrame([analysis['summary']])
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
+                summary = analysis['summary']
+                self._write_sheet(workbook, 'Summary', list(summary.keys()), [list(summary.values())], date_format)
             
             print(f"✅ Analysis exported to: {filename}")
             return filename
@@ -221,20 +375,20 @@ class GoogleSearchBusinessIntel:
         print("🏢 MARKET RESEARCH ANALYSIS")
         print("=" * 40)
         
-        # Compare product keywords
+        # Compare product keywords and get their related queries
         print("📊 Analyzing product keywords...")
-        product_trends = self.trends_analyzer.compare_keywords(product_keywords, timeframe)
+        print(f"🔍 Getting related queries for: {', '.join(product_keywords)}")
+        if len(product_keywords) <= 5:
+            # One payload serves both the comparison and the related queries
+            product_trends, related_data = self.trends_analyzer._compare_with_related(product_keywords, timeframe)
+        else:
+            product_trends = self.trends_analyzer.compare_keywords(product_keywords, timeframe)
+            related_data = self.trends_analyzer.get_related_queries_batch(product_keywords, timeframe)
         
         # Compare competitor keywords
         print("🏆 Analyzing competitor keywords...")
         competitor_trends = self.trends_analyzer.compare_keywords(competitor_keywords, timeframe)
         
-        # Get related queries for each product
-        related_data = {}
-        for keyword in product_keywords:
-            print(f"🔍 Getting related queries for: {keyword}")
-            related_data[keyword] = self.trends_analyzer.get_related_queries(keyword, timeframe)
-        
         return {
             'product_trends': product_trends,
             'competitor_trends': competitor_trends,
@@ -245,20 +399,34 @@ class GoogleSearchBusinessIntel:
     def seasonal_analysis(self, keywords, years=2):
         """
         Analyze seasonal patterns
+        Returns per keyword the raw weekly frame plus its average interest per calendar month and per year
         """
         timeframe = f'today {years*12}-m'  # Convert years to months
         
         print(f"📅 SEASONAL ANALYSIS ({years} years)")
         print("=" * 40)
         
-        seasonal_data = {}
-        for keyword in keywords:
+        # build_payload keeps state on the TrendReq instance, so each worker thread needs its own
+        # client; one per thread (not per keyword) keeps Google's cookie requests, and its 429s, down
+        workers = threading.local()
+        
+        def fetch_trends(keyword):
             print(f"📈 Analyzing seasonal patterns for: {keyword}")
-            trends = self.trends_analyzer.get_interest_over_time([keyword], timeframe)
+            if not hasattr(workers, 'analyzer'):
+                workers.analyzer = GoogleTrendsSearchAnalyzer()
+            return workers.analyzer.get_interest_over_time([keyword], timeframe)
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=SEASONAL_WORKERS) as executor:
+            all_trends = list(executor.map(fetch_trends, keywords))
+        
+        seasonal_data = {}
+        for keyword, trends in zip(keywords, all_trends):
             if not trends.empty:
-                trends['month'] = trends.index.month
-                trends['year'] = trends.index.year
-                seasonal_data[keyword] = trends
+                seasonal_data[keyword] = {
+                    'raw': trends,
+                    'monthly_mean': trends.groupby(trends.index.month).mean(numeric_only=True),
+                    'yearly_mean': trends.groupby(trends.index.year).mean(numeric_only=True)
+                }
         
         return seasonal_data
     
@@ -333,7 +501,7 @@ def demo_analysis():
 
 if __name__ == "__main__":
     # Required packages to install:
-    # pip install pytrends pandas matplotlib seaborn requests beautifulsoup4 openpyxl
+    # pip install pytrends pandas matplotlib seaborn requests beautifulsoup4 xlsxwriter requests-cache
     
     print("📋 GOOGLE TRENDS & SEARCH ANALYZER")
     print("=" * 50)
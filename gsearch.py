@@ -1,13 +1,220 @@
 # Method 1: Using Google Custom Search API (Recommended)
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-from bs4 import BeautifulSoup
+import re
 import time
+from collections import defaultdict
+from urllib.parse import urlparse
+from selectolax.lexbor import LexborHTMLParser
+import asyncio
+import aiohttp
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Concurrent extraction: unrelated domains run in parallel, the same domain at most
+# PER_DOMAIN_LIMIT at a time and no more often than every DOMAIN_MIN_WAIT seconds
+GLOBAL_FETCH_LIMIT = 20
+PER_DOMAIN_LIMIT = 1
+DOMAIN_MIN_WAIT = 1.0
+
+# Only the first 2000 characters of text are kept, so there is no point downloading whole pages
+MAX_BODY_BYTES = 256 * 1024
+CHUNK_SIZE = 64 * 1024
+
+_WS_RE = re.compile(r'\s+')
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?\s*([\w-]+)', re.IGNORECASE)
+
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+def _make_session(cache_name=None):
+    """
+    Creates a requests session with a keep-alive connection pool and retries on transient errors.
+    With a cache_name (and requests-cache installed) successful responses are cached on disk for an hour;
+    the Custom Search API key ('key' parameter) is left out of the cache keys and the stored requests.
+    """
+    if cache_name and requests_cache:
+        session = requests_cache.CachedSession(cache_name, backend='sqlite', expire_after=3600, allowable_codes=(200,),
+                                               ignored_parameters=['key'])
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50,
+                          max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_SESSION = _make_session()
+
+
+def _read_capped(response):
+    """
+    Reads a streamed requests response up to MAX_BODY_BYTES.
+    Returns the bytes and the charset declared in the Content-Type (None if there is none).
+    """
+    chunks = []
+    total = 0
+    for chunk in response.iter_content(CHUNK_SIZE):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= MAX_BODY_BYTES:
+            break
+    # requests reports ISO-8859-1 for any charset-less text/* response, which would hide the <meta charset>
+    charset = response.encoding if 'charset' in response.headers.get('Content-Type', '').lower() else None
+    return b''.join(chunks)[:MAX_BODY_BYTES], charset
+
+
+def _decode_html(content, charset=None):
+    """
+    Lexbor only reads UTF-8, so bytes are decoded with the HTTP charset or the page's <meta charset> first
+    """
+    if not charset:
+        match = _META_CHARSET_RE.search(content, 0, 4096)
+        charset = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        return content.decode(charset, errors='replace')
+    except LookupError:
+        return content.decode('utf-8', errors='replace')
+
+
+def _probe_html(session, url, headers):
+    """
+    Cheap HEAD request before the real download: raises for dead links and non-HTML content.
+    Servers that reject HEAD (405/501) are let through to the GET.
+    """
+    head = session.head(url, headers=headers, allow_redirects=True, timeout=5)
+    if head.status_code in (405, 501):
+        return
+    head.raise_for_status()
+    content_type = head.headers.get('Content-Type', '')
+    if content_type and 'html' not in content_type:
+        raise ValueError(f"Not an HTML page ({content_type})")
+
+
+def _parse_page_content(url, content, charset=None):
+    """
+    Turns a downloaded HTML page into the url/title/content/word_count dict
+    """
+    tree = LexborHTMLParser(_decode_html(content, charset))
+    
+    # Remove script and style elements
+    for node in tree.css("script, style"):
+        node.decompose()
+    
+    # Get text content
+    title = tree.css_first("title")
+    root = tree.body or tree.root
+    text = root.text(separator=' ', strip=True, skip_empty=True) if root else ''
+    
+    # Clean up text
+    text = _WS_RE.sub(' ', text).strip()
+    
+    return {
+        'url': url,
+        'title': title.text(strip=True) if title else 'No title',
+        'content': text[:2000],  # First 2000 characters
+        'word_count': len(text.split())
+    }
+
+
+def _extract_page_content(url, session=_SESSION):
+    """
+    Extracts content from a webpage
+    """
+    try:
+        _probe_html(session, url, _DEFAULT_HEADERS)
+        with session.get(url, headers=_DEFAULT_HEADERS, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            content, charset = _read_capped(response)
+        
+        return _parse_page_content(url, content, charset)
+    except Exception as e:
+        return {
+            'url': url,
+            'error': str(e),
+            'content': None
+        }
+
+
+async def _fetch(session, url):
+    async with session.get(url, headers=_DEFAULT_HEADERS, timeout=aiohttp.ClientTimeout(total=15)) as response:
+        response.raise_for_status()
+        # Same check as _probe_html, made on the GET's headers before any of the body is read
+        if 'Content-Type' in response.headers and 'html' not in response.content_type:
+            raise ValueError(f"Not an HTML page ({response.content_type})")
+        chunks = []
+        total = 0
+        async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= MAX_BODY_BYTES:
+                break
+        return b''.join(chunks)[:MAX_BODY_BYTES], response.charset
+
+
+async def _fetch_all(session, urls):
+    global_sem = asyncio.Semaphore(GLOBAL_FETCH_LIMIT)
+    domain_sems = defaultdict(lambda: asyncio.Semaphore(PER_DOMAIN_LIMIT))
+    last_fetch = {}
+    
+    async def fetch(url):
+        domain = urlparse(url).netloc.lower()
+        async with domain_sems[domain]:
+            if domain in last_fetch:
+                await asyncio.sleep(max(0, DOMAIN_MIN_WAIT - (time.monotonic() - last_fetch[domain])))
+            try:
+                async with global_sem:
+                    return await _fetch(session, url)
+            finally:
+                last_fetch[domain] = time.monotonic()
+    
+    return await asyncio.gather(*[fetch(url) for url in urls], return_exceptions=True)
+
+
+async def _extract_all_async(urls):
+    connector = aiohttp.TCPConnector(limit=GLOBAL_FETCH_LIMIT, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        pages = await _fetch_all(session, urls)
+    
+    extracted = []
+    for url, page in zip(urls, pages):
+        if isinstance(page, Exception):
+            extracted.append({'url': url, 'error': str(page), 'content': None})
+            continue
+        try:
+            extracted.append(_parse_page_content(url, *page))
+        except Exception as e:
+            extracted.append({'url': url, 'error': str(e), 'content': None})
+    return extracted
+
+
+def extract_all(urls):
+    """
+    Downloads all urls concurrently and extracts their content, keeping input order
+    """
+    return asyncio.run(_extract_all_async(urls))
 
 class WebSearchExtractor:
     def __init__(self, api_key=None, search_engine_id=None):
         self.api_key = api_key
         self.search_engine_id = search_engine_id
+        self._session = _make_session()
+        self._search_session = _make_session(cache_name='google_search_cache')
     
     def google_custom_search(self, query, num_results=4):
         """
@@ -27,8 +234,8 @@ class WebSearchExtractor:
         }
         
         try:
-            response = requests.get(url, params=params)
-            data = response.json()
+            response = self._search_session.get(url, params=params)
+            data = _json_loads(response.content)
             
             results = []
             if 'items' in data:
@@ -47,39 +254,7 @@ class WebSearchExtractor:
         """
         Extracts content from a webpage
         """
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Get text content
-            text = soup.get_text()
-            
-            # Clean up text
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = ' '.join(chunk for chunk in chunks if chunk)
-            
-            return {
-                'url': url,
-                'title': soup.title.string if soup.title else 'No title',
-                'content': text[:2000],  # First 2000 characters
-                'word_count': len(text.split())
-            }
-        except Exception as e:
-            return {
-                'url': url,
-                'error': str(e),
-                'content': None
-            }
+        return _extract_page_content(url, self._session)
     
     def search_and_extract(self, query, num_results=4):
         """
@@ -94,12 +269,12 @@ class WebSearchExtractor:
             print("No search results found")
             return []
         
-        # Extract content from each result
+        # Extract content from all results concurrently
+        print(f"Extracting content from {len(search_results)} results")
+        pages = extract_all([result['url'] for result in search_results])
+        
         extracted_data = []
-        for i, result in enumerate(search_results, 1):
-            print(f"Extracting content from result {i}: {result['url']}")
-            content_data = self.extract_page_content(result['url'])
-            
+        for i, (result, content_data) in enumerate(zip(search_results, pages), 1):
             # Combine search result info with extracted content
             combined_data = {
                 'rank': i,
@@ -112,9 +287,6 @@ class WebSearchExtractor:
                 'extraction_error': content_data.get('error')
             }
             extracted_data.append(combined_data)
-            
-            # Be respectful to servers
-            time.sleep(1)
         
         return extracted_data
 
@@ -125,6 +297,7 @@ from duckduckgo_search import DDGS
 class DuckDuckGoSearchExtractor:
     def __init__(self):
         self.ddgs = DDGS()
+        self._session = _make_session()
     
     def search_and_extract(self, query, num_results=4):
         """
@@ -136,13 +309,12 @@ class DuckDuckGoSearchExtractor:
             # Get search results
             results = list(self.ddgs.text(query, max_results=num_results))
             
+            # Extract page content from all results concurrently
+            print(f"Extracting content from {len(results)} results")
+            pages = extract_all([result['href'] for result in results])
+            
             extracted_data = []
-            for i, result in enumerate(results, 1):
-                print(f"Extracting content from result {i}: {result['href']}")
-                
-                # Extract page content
-                content_data = self.extract_page_content(result['href'])
-                
+            for i, (result, content_data) in enumerate(zip(results, pages), 1):
                 combined_data = {
                     'rank': i,
                     'search_title': result['title'],
@@ -154,8 +326,6 @@ class DuckDuckGoSearchExtractor:
                     'extraction_error': content_data.get('error')
                 }
                 extracted_data.append(combined_data)
-                
-                time.sleep(1)
             
             return extracted_data
             
@@ -167,35 +337,7 @@ class DuckDuckGoSearchExtractor:
         """
         Same as above method
         """
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            text = soup.get_text()
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = ' '.join(chunk for chunk in chunks if chunk)
-            
-            return {
-                'url': url,
-                'title': soup.title.string if soup.title else 'No title',
-                'content': text[:2000],
-                'word_count': len(text.split())
-            }
-        except Exception as e:
-            return {
-                'url': url,
-                'error': str(e),
-                'content': None
-            }
+        return _extract_page_content(url, self._session)
 
 
 # Usage Examples
@@ -230,7 +372,7 @@ if __name__ == "__main__":
 
 
 # Required packages to install:
-# pip install requests beautifulsoup4 duckduckgo-search
+# pip install requests selectolax duckduckgo-search aiohttp requests-cache
 
 # For Google Custom Search API setup:
 # 1. Go to Google Cloud Console
@@ -1,21 +1,41 @@
 import requests
-from bs4 import BeautifulSoup
+from duckduckgo_search import DDGS
 import time
 import random
+import itertools
 from urllib.parse import urljoin, urlparse
+from email.utils import parsedate_to_datetime
 import json
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional, Union
 import re
+import hashlib
 from readability import Document
+import lxml.html
+from lxml import etree
 import trafilatura
 import logging
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import httpx
+import os
+
+try:
+    import h2  # noqa: F401 (enables httpx HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedContent:
     url: str
     title: str
@@ -26,53 +46,138 @@ class ScrapedContent:
     word_count: int = 0
     
 class AdvancedWebScraper:
-    def __init__(self):
-        self.session = requests.Session()
+    # Article text never lives past the first couple of MB; bigger declared pages are skipped outright
+    MAX_BODY_BYTES = 2_000_000
+    MAX_CONTENT_LENGTH = 5_000_000
+    CHUNK_SIZE = 65536
+    # Politeness is per host: at most one request every HOST_MIN_INTERVAL seconds to the same site
+    HOST_MIN_INTERVAL = 1.5
+    
+    def __init__(self, max_connections: int = 10, cache_file: Optional[str] = "scraper_http_cache.json",
+                 parallel: bool = False):
+        # Upper bound on simultaneous downloads in scrape_search_results
+        self.max_connections = max_connections
+        # Parse pages in a process pool (one worker per core) instead of a thread; pays off on large batches
+        self.parallel = parallel
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        # ETag / Last-Modified of previously scraped pages, for conditional GETs across runs
+        self.cache_file = cache_file
+        self._http_cache = self._load_http_cache()
+        # Earliest monotonic time the next request to each host may start
+        self._host_next_slot: Dict[str, float] = {}
+        # (title, content) by body digest, so mirrored / syndicated pages are parsed once per run
+        self._parsed_cache: Dict[bytes, tuple] = {}
+        
+        # Boilerplate filters for manual extraction, compiled once
+        self.unwanted_tags = [
+            'nav', 'header', 'footer', 'aside', 'script', 'style', 
+            'noscript', 'iframe', 'form', 'button', 'input',
+            'advertisement', 'ad', 'sidebar', 'menu'
+        ]
+        
+        unwanted_classes = [
+            'nav', 'navbar', 'navigation', 'header', 'footer', 'sidebar',
+            'menu', 'ad', 'advertisement', 'ads', 'social', 'share',
+            'comment', 'comments', 'related', 'recommended', 'popup',
+            'modal', 'cookie', 'subscribe', 'newsletter'
+        ]
+        
+        unwanted_ids = [
+            'header', 'footer', 'nav', 'navbar', 'sidebar', 'menu',
+            'advertisement', 'ads', 'social', 'comments'
+        ]
+        
+        # One XPath for both lists (partial, case-insensitive match), evaluated in C in a single walk
+        lower = "translate(@{}, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+        conditions = [f"contains({lower.format('class')}, '{name}')" for name in unwanted_classes]
+        conditions += [f"contains({lower.format('id')}, '{name}')" for name in unwanted_ids]
+        self._unwanted_xpath = etree.XPath(f"//*[{' or '.join(conditions)}]")
+        
+        # Main content containers, in order of preference (CSS selector -> compiled XPath)
+        self.main_content_selectors = [
+            'main', 'article', '[role="main"]', '.main-content',
+            '.content', '.post-content', '.entry-content', '.article-body',
+            '.story-body', '.article-content', '#content', '#main'
+        ]
+        # One union XPath collects every candidate in a single walk; the per-selector self:: tests
+        # then pick the first candidate in preference order without touching the rest of the tree
+        self._main_content_xpath = etree.XPath(' | '.join(self._selector_to_xpath(selector)
+                                                          for selector in self.main_content_selectors))
+        self._main_content_tests = [etree.XPath(self._selector_to_xpath(selector, axis='self::'))
+                                    for selector in self.main_content_selectors]
+        # Cheap pre-check: a substantial <article>/<main> is used as-is without running trafilatura
+        self._article_xpath = etree.XPath('//article|//main')
+        self._visible_text_xpath = etree.XPath('.//text()[not(ancestor::script or ancestor::style or ancestor::noscript)]')
+        self.min_article_length = 500
         # Rotate user agents to avoid detection
         self.user_agents = [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         ]
-        self.session.headers.update({
+        # Default headers for every request of the shared client (keep-alive is handled by the pool)
+        self.headers = {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
+            'Referer': 'https://www.google.com/',
+        }
+        # Only the user agent varies per request; the dicts are built once and handed out round-robin
+        self._header_cycle = itertools.cycle([{'User-Agent': ua} for ua in self.user_agents])
+    
+    @staticmethod
+    def _selector_to_xpath(selector: str, axis: str = '//') -> str:
+        """
+        Translate the simple tag / .class / #id / [attr="value"] selectors used here into XPath
+        (a document search by default, or a test on the current element with axis='self::')
+        """
+        if selector.startswith('.'):
+            return f"{axis}*[contains(concat(' ', normalize-space(@class), ' '), ' {selector[1:]} ')]"
+        if selector.startswith('#'):
+            return f"{axis}*[@id='{selector[1:]}']"
+        if selector.startswith('['):
+            attr, value = selector[1:-1].split('=', 1)
+            return f"{axis}*[@{attr}={value}]"
+        return f"{axis}{selector}"
+    
+    @staticmethod
+    def _element_text(element) -> str:
+        """
+        Same result as BeautifulSoup's get_text(strip=True, separator=' ')
+        """
+        return ' '.join(text.strip() for text in element.itertext() if text.strip())
+    
+    def _load_http_cache(self) -> Dict[str, Dict]:
+        """
+        Load validators and extracted content of previously scraped pages
+        """
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable HTTP cache {self.cache_file}: {str(e)}")
+            return {}
+    
+    def _save_http_cache(self):
+        """
+        Persist the conditional-GET cache for the next run
+        """
+        if not self.cache_file:
+            return
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump(self._http_cache, f, ensure_ascii=False)
     
     def search_duckduckgo(self, query: str, num_results: int = 10) -> List[str]:
         """
         Search DuckDuckGo and return list of URLs
         """
         try:
-            # DuckDuckGo instant answers API
-            search_url = "https://html.duckduckgo.com/html/"
-            params = {
-                'q': query,
-                'b': '',  # Start from beginning
-                'kl': 'us-en',  # Language
-                'df': '',  # Date filter
-                's': '0',   # Start position
-            }
-            
-            headers = {
-                'User-Agent': random.choice(self.user_agents)
-            }
-            
-            response = self.session.get(search_url, params=params, headers=headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract URLs from search results
-            urls = []
-            result_links = soup.find_all('a', {'class': 'result__a'})
-            
-            for link in result_links[:num_results]:
-                href = link.get('href')
-                if href and href.startswith('http'):
-                    urls.append(href)
+            # duckduckgo_search talks to DuckDuckGo's JSON endpoints, no SERP HTML to parse
+            with DDGS() as ddgs:
+                urls = [r['href'] for r in ddgs.text(query, region='us-en', max_results=num_results)
+                        if r.get('href', '').startswith('http')]
             
             logger.info(f"Found {len(urls)} URLs from DuckDuckGo search")
             return urls
@@ -85,22 +190,28 @@ class AdvancedWebScraper:
         """
         Check if response is valid for scraping
         """
-        if response.status_code != 200:
+        return self.is_valid_page(response.status_code, response.headers.get('content-type', ''), response.content)
+    
+    def is_valid_page(self, status_code: int, content_type: str, body: bytes) -> bool:
+        """
+        Check if a downloaded page (status, content type, body) is valid for scraping
+        """
+        if status_code != 200:
             return False
         
-        content_type = response.headers.get('content-type', '').lower()
-        if 'text/html' not in content_type:
+        if 'text/html' not in content_type.lower():
             return False
         
         # Check if content is not empty
-        if len(response.content) < 100:
+        if len(body) < 100:
             return False
         
         return True
     
-    def extract_content_trafilatura(self, html: str, url: str) -> Optional[str]:
+    def extract_content_trafilatura(self, html: Union[str, bytes, lxml.html.HtmlElement], url: str) -> Optional[str]:
         """
-        Extract main content using trafilatura (best for news articles and blogs)
+        Extract main content using trafilatura (best for news articles and blogs).
+        Accepts an already parsed tree, which trafilatura copies instead of re-parsing.
         """
         try:
             extracted = trafilatura.extract(html, include_comments=False, 
@@ -109,145 +220,266 @@ class AdvancedWebScraper:
         except:
             return None
     
-    def extract_content_readability(self, html: str, url: str) -> Optional[str]:
+    def extract_content_readability(self, html: Union[str, bytes, lxml.html.HtmlElement], url: str) -> Optional[str]:
         """
-        Extract main content using readability (Mozilla's algorithm)
+        Extract main content using readability (Mozilla's algorithm).
+        Accepts an already parsed tree (readability only drops hidden elements from it).
         """
         try:
             doc = Document(html)
-            soup = BeautifulSoup(doc.content(), 'html.parser')
-            return soup.get_text(strip=True, separator=' ')
+            # summary() is already cleaned HTML; read its text straight from lxml instead of re-parsing with bs4
+            tree = lxml.html.fromstring(doc.summary(html_partial=True))
+            return ' '.join(text.strip() for text in tree.itertext() if text.strip())
         except:
             return None
     
-    def extract_content_manual(self, soup: BeautifulSoup, url: str) -> str:
+    def extract_content_manual(self, tree: lxml.html.HtmlElement, url: str) -> str:
         """
         Manual content extraction with advanced filtering
         """
-        # Remove unwanted elements
-        unwanted_tags = [
-            'nav', 'header', 'footer', 'aside', 'script', 'style', 
-            'noscript', 'iframe', 'form', 'button', 'input',
-            'advertisement', 'ad', 'sidebar', 'menu'
-        ]
-        
-        unwanted_classes = [
-            'nav', 'navbar', 'navigation', 'header', 'footer', 'sidebar',
-            'menu', 'ad', 'advertisement', 'ads', 'social', 'share',
-            'comment', 'comments', 'related', 'recommended', 'popup',
-            'modal', 'cookie', 'subscribe', 'newsletter'
-        ]
-        
-        unwanted_ids = [
-            'header', 'footer', 'nav', 'navbar', 'sidebar', 'menu',
-            'advertisement', 'ads', 'social', 'comments'
-        ]
+        # Remove unwanted elements (one C-level pass for all tag names)
+        etree.strip_elements(tree, *self.unwanted_tags, with_tail=False)
         
-        # Remove by tag name
-        for tag in unwanted_tags:
-            for element in soup.find_all(tag):
-                element.decompose()
-        
-        # Remove by class name (partial matching)
-        for class_name in unwanted_classes:
-            for element in soup.find_all(class_=re.compile(class_name, re.I)):
-                element.decompose()
-        
-        # Remove by ID (partial matching)
-        for id_name in unwanted_ids:
-            for element in soup.find_all(id=re.compile(id_name, re.I)):
-                element.decompose()
-        
-        # Find main content containers
-        main_content_selectors = [
-            'main', 'article', '[role="main"]', '.main-content',
-            '.content', '.post-content', '.entry-content', '.article-body',
-            '.story-body', '.article-content', '#content', '#main'
-        ]
+        # Remove by class name / ID (partial matching); drop_tree keeps the trailing text like decompose did
+        for element in self._unwanted_xpath(tree):
+            if element.getparent() is not None:
+                element.drop_tree()
         
         content_text = ""
         
         # Try to find main content container
-        for selector in main_content_selectors:
-            main_container = soup.select_one(selector)
-            if main_container:
-                content_text = main_container.get_text(strip=True, separator=' ')
+        candidates = self._main_content_xpath(tree)
+        for is_match in self._main_content_tests:
+            main_container = next((element for element in candidates if is_match(element)), None)
+            if main_container is not None:
+                content_text = self._element_text(main_container)
                 if len(content_text) > 100:  # Minimum content length
                     break
         
         # Fallback: extract from body if main content not found
         if not content_text or len(content_text) < 100:
-            body = soup.find('body')
-            if body:
-                content_text = body.get_text(strip=True, separator=' ')
+            body = tree.find('.//body')
+            if body is not None:
+                content_text = self._element_text(body)
         
-        # Clean up the text
-        content_text = re.sub(r'\s+', ' ', content_text)  # Multiple spaces to single
-        content_text = re.sub(r'\n+', '\n', content_text)  # Multiple newlines to single
+        # Clean up the text: collapse all whitespace runs (newlines included) in one C-level pass
+        return ' '.join(content_text.split())
+    
+    def _make_client(self) -> httpx.AsyncClient:
+        """
+        Persistent connection pool for one batch of scrapes; multiplexes over HTTP/2 when h2 is installed
+        """
+        return httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            headers=self.headers,
+            follow_redirects=True,
+            timeout=30
+        )
+    
+    async def _wait_for_host(self, host: str):
+        """
+        Reserve the next request slot for host and sleep until it comes; other hosts are not delayed
+        """
+        now = time.monotonic()
+        slot = max(now, self._host_next_slot.get(host, 0))
+        self._host_next_slot[host] = slot + self.HOST_MIN_INTERVAL
+        await asyncio.sleep(slot - now)
+    
+    @staticmethod
+    def _retry_after_seconds(headers: httpx.Headers) -> Optional[float]:
+        """
+        Seconds to back off from Retry-After (delta or HTTP date) or X-RateLimit-Reset (delta or epoch)
+        """
+        value = headers.get('Retry-After')
+        if value:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        value = headers.get('X-RateLimit-Reset')
+        if value:
+            try:
+                reset = float(value)
+            except ValueError:
+                return None
+            # Large values are Unix timestamps, small ones a number of seconds
+            return max(0.0, reset - time.time()) if reset > 1e9 else reset
+        return None
+    
+    def _back_off_host(self, host: str, delay: float):
+        """
+        Push the host's next request slot back by delay seconds after a rate-limit response
+        """
+        logger.info(f"Backing off {host} for {delay:.1f}s")
+        self._host_next_slot[host] = max(self._host_next_slot.get(host, 0), time.monotonic() + delay)
+    
+    async def _read_capped(self, response: httpx.Response) -> bytes:
+        """
+        Read the response body in chunks, stopping after MAX_BODY_BYTES
+        """
+        chunks = []
+        total = 0
+        async for chunk in response.aiter_bytes(self.CHUNK_SIZE):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total > self.MAX_BODY_BYTES:
+                break
+        return b''.join(chunks)
+    
+    def _parse_page(self, body: bytes, url: str, encoding: Optional[str] = None) -> tuple:
+        """
+        Extract (title, content) from a downloaded HTML page
+        """
+        # libxml2 decodes the bytes itself: from the HTTP charset when known, else the page's <meta>
+        parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+        tree = lxml.html.document_fromstring(body, parser=parser)
+        
+        # Extract title
+        title_tag = tree.find('.//title')
+        title = title_tag.text_content().strip() if title_tag is not None else "No title found"
+        
+        # Try multiple content extraction methods
+        content = None
         
-        return content_text.strip()
+        # Method 0: A clearly marked-up article needs no heuristics
+        article = self._article_xpath(tree)
+        if article:
+            text = ' '.join(' '.join(self._visible_text_xpath(article[0])).split())
+            if len(text) > self.min_article_length:
+                content = text
+        
+        # Every extractor works from the same parsed tree; manual extraction goes last as it strips it in place
+        # Method 1: Trafilatura (best for articles)
+        if not content:
+            content = self.extract_content_trafilatura(tree, url)
+        
+        # Method 2: Readability (Mozilla's algorithm)
+        if not content or len(content) < 100:
+            content = self.extract_content_readability(tree, url)
+        
+        # Method 3: Manual extraction
+        if not content or len(content) < 100:
+            content = self.extract_content_manual(tree, url)
+        
+        if not content:
+            content = "Failed to extract meaningful content"
+        
+        return title, content
     
-    def scrape_url(self, url: str) -> ScrapedContent:
+    async def scrape_url_async(self, client: httpx.AsyncClient, url: str) -> ScrapedContent:
         """
-        Scrape a single URL with advanced content extraction
+        Scrape a single URL with advanced content extraction, using a shared httpx client
         """
         try:
-            headers = {
-                'User-Agent': random.choice(self.user_agents),
-                'Referer': 'https://www.google.com/',
-            }
+            headers = next(self._header_cycle)
             
-            # Add random delay to avoid being blocked
-            time.sleep(random.uniform(1, 3))
+            # Ask the server to skip the body if the page hasn't changed since the last scrape
+            cached = self._http_cache.get(url)
+            if cached:
+                headers = dict(headers)
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+            
+            # Rate limit per host; requests to other sites go out immediately
+            host = urlparse(url).netloc.lower()
+            await self._wait_for_host(host)
             
             logger.info(f"Scraping: {url}")
-            response = self.session.get(url, headers=headers, timeout=30)
+            async with client.stream('GET', url, headers=headers) as response:
+                status_code = response.status_code
+                content_length = int(response.headers.get('content-length') or 0)
+                if content_length > self.MAX_CONTENT_LENGTH:
+                    return ScrapedContent(
+                        url=url,
+                        title="",
+                        content="",
+                        status_code=status_code,
+                        success=False,
+                        error_message=f"Page too large: {content_length} bytes"
+                    )
+                content_type = response.headers.get('content-type', '')
+                if status_code == 200 and 'text/html' not in content_type.lower():
+                    # Only the headers have been read, so PDFs, images and videos are never downloaded
+                    return ScrapedContent(
+                        url=url,
+                        title="",
+                        content="",
+                        status_code=status_code,
+                        success=False,
+                        error_message=f"Not an HTML page: {content_type or 'unknown content type'}"
+                    )
+                encoding = response.charset_encoding
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if status_code in (403, 429, 503):
+                    delay = self._retry_after_seconds(response.headers)
+                    if delay is not None:
+                        self._back_off_host(host, delay)
+                # Error and 304 bodies are never used, so skip reading them too
+                body = await self._read_capped(response) if status_code == 200 else b''
+            
+            if status_code == 304 and cached:
+                logger.info(f"Not modified since last scrape: {url}")
+                return ScrapedContent(
+                    url=url,
+                    title=cached['title'],
+                    content=cached['content'],
+                    status_code=cached['status_code'],
+                    success=True,
+                    word_count=cached['word_count']
+                )
             
-            if not self.is_valid_response(response):
+            if not self.is_valid_page(status_code, content_type, body):
                 return ScrapedContent(
                     url=url,
                     title="",
                     content="",
-                    status_code=response.status_code,
+                    status_code=status_code,
                     success=False,
-                    error_message=f"Invalid response: {response.status_code}"
+                    error_message=f"Invalid response: {status_code}"
                 )
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract title
-            title_tag = soup.find('title')
-            title = title_tag.get_text(strip=True) if title_tag else "No title found"
-            
-            # Try multiple content extraction methods
-            content = None
-            
-            # Method 1: Trafilatura (best for articles)
-            content = self.extract_content_trafilatura(response.text, url)
-            
-            # Method 2: Readability (Mozilla's algorithm)
-            if not content or len(content) < 100:
-                content = self.extract_content_readability(response.text, url)
-            
-            # Method 3: Manual extraction
-            if not content or len(content) < 100:
-                content = self.extract_content_manual(soup, url)
-            
-            if not content:
-                content = "Failed to extract meaningful content"
-            
+            # Parsing is CPU-bound; run it off the event loop so other downloads keep flowing
+            body_key = hashlib.blake2b(body, digest_size=16).digest()
+            parsed = self._parsed_cache.get(body_key)
+            if parsed is None:
+                if self._process_pool:
+                    parsed = await asyncio.get_running_loop().run_in_executor(
+                        self._process_pool, _parse_page_in_worker, body, url, encoding)
+                else:
+                    parsed = await asyncio.to_thread(self._parse_page, body, url, encoding)
+                self._parsed_cache[body_key] = parsed
+            else:
+                logger.info(f"Identical page already parsed, reusing it: {url}")
+            title, content = parsed
             word_count = len(content.split())
             
+            if etag or last_modified:
+                self._http_cache[url] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'title': title,
+                    'content': content,
+                    'status_code': status_code,
+                    'word_count': word_count
+                }
+            
             return ScrapedContent(
                 url=url,
                 title=title,
                 content=content,
-                status_code=response.status_code,
+                status_code=status_code,
                 success=True,
                 word_count=word_count
             )
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Request error for {url}: {str(e)}")
             return ScrapedContent(
                 url=url,
@@ -268,9 +500,58 @@ class AdvancedWebScraper:
                 error_message=f"Unexpected error: {str(e)}"
             )
     
-    def scrape_search_results(self, query: str, num_results: int = 10) -> List[ScrapedContent]:
+    async def _scrape_urls_async(self, urls: List[str], output_file: Optional[str] = None) -> List[ScrapedContent]:
+        """
+        Scrape all URLs concurrently over one httpx client, at most max_connections at a time.
+        With output_file, each result is appended to it as a JSON line as soon as it finishes.
+        """
+        semaphore = asyncio.Semaphore(self.max_connections)
+        if self.parallel:
+            self._process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        
+        try:
+            results = await self._gather_scrapes(urls, semaphore, output_file)
+        finally:
+            if self._process_pool:
+                self._process_pool.shutdown()
+                self._process_pool = None
+        
+        self._save_http_cache()
+        return results
+    
+    async def _gather_scrapes(self, urls: List[str], semaphore: asyncio.Semaphore,
+                              output_file: Optional[str]) -> List[ScrapedContent]:
+        """
+        Run the bounded scrapes of one batch over a fresh httpx client
+        """
+        async with self._make_client() as client:
+            async def scrape_bounded(i: int, url: str) -> ScrapedContent:
+                async with semaphore:
+                    logger.info(f"Processing {i}/{len(urls)}: {url}")
+                    result = await self.scrape_url_async(client, url)
+                
+                # Log result summary
+                if result.success:
+                    logger.info(f"✓ Success - {result.word_count} words extracted")
+                else:
+                    logger.warning(f"✗ Failed - {result.error_message}")
+                if output_file:
+                    self.append_result(result, output_file)
+                return result
+            
+            return await asyncio.gather(*[scrape_bounded(i, url) for i, url in enumerate(urls, 1)])
+    
+    def scrape_url(self, url: str) -> ScrapedContent:
+        """
+        Scrape a single URL with advanced content extraction
+        """
+        return asyncio.run(self._scrape_urls_async([url]))[0]
+    
+    def scrape_search_results(self, query: str, num_results: int = 10,
+                              output_file: Optional[str] = None) -> List[ScrapedContent]:
         """
         Main function: Search DuckDuckGo and scrape results
+        (streamed to output_file as JSON Lines while scraping, if given)
         """
         logger.info(f"Starting search and scrape for: '{query}'")
         
@@ -281,42 +562,46 @@ class AdvancedWebScraper:
             logger.warning("No URLs found from search")
             return []
         
-        # Step 2: Scrape each URL
-        results = []
-        for i, url in enumerate(urls, 1):
-            logger.info(f"Processing {i}/{len(urls)}: {url}")
-            result = self.scrape_url(url)
-            results.append(result)
-            
-            # Log result summary
-            if result.success:
-                logger.info(f"✓ Success - {result.word_count} words extracted")
-            else:
-                logger.warning(f"✗ Failed - {result.error_message}")
-        
-        return results
+        # Step 2: Scrape all URLs concurrently
+        return asyncio.run(self._scrape_urls_async(urls, output_file))
     
-    def save_results(self, results: List[ScrapedContent], filename: str = "scraping_results.json"):
-        """
-        Save results to JSON file
-        """
-        data = []
-        for result in results:
-            data.append({
-                'url': result.url,
-                'title': result.title,
-                'content': result.content,
-                'status_code': result.status_code,
-                'success': result.success,
-                'error_message': result.error_message,
-                'word_count': result.word_count
-            })
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    @staticmethod
+    def _result_line(result: ScrapedContent) -> bytes:
+        """
+        One result as a UTF-8 JSON line
+        """
+        if orjson:
+            return orjson.dumps(asdict(result), option=orjson.OPT_APPEND_NEWLINE)
+        return (json.dumps(asdict(result), ensure_ascii=False) + '\n').encode('utf-8')
+    
+    def append_result(self, result: ScrapedContent, filename: str = "scraping_results.jsonl"):
+        """
+        Append a single result to a JSON Lines file
+        """
+        with open(filename, 'ab') as f:
+            f.write(self._result_line(result))
+    
+    def save_results(self, results: List[ScrapedContent], filename: str = "scraping_results.jsonl"):
+        """
+        Save results to a JSON Lines file, one result per line
+        """
+        with open(filename, 'wb') as f:
+            for result in results:
+                f.write(self._result_line(result))
         
         logger.info(f"Results saved to {filename}")
 
+_worker_scraper: Optional[AdvancedWebScraper] = None
+
+def _parse_page_in_worker(body: bytes, url: str, encoding: Optional[str]) -> tuple:
+    """
+    Process-pool entry point: compiled XPaths don't pickle, so each worker builds its own scraper once
+    """
+    global _worker_scraper
+    if _worker_scraper is None:
+        _worker_scraper = AdvancedWebScraper(cache_file=None)
+    return _worker_scraper._parse_page(body, url, encoding)
+
 # Example usage
 if __name__ == "__main__":
     scraper = AdvancedWebScraper()
@@ -324,8 +609,8 @@ if __name__ == "__main__":
     # Search query
     query = "artificial intelligence latest developments 2024"
     
-    # Scrape search results
-    results = scraper.scrape_search_results(query, num_results=10)
+    # Scrape search results, writing each one to disk as it completes
+    results = scraper.scrape_search_results(query, num_results=10, output_file="scraping_results.jsonl")
     
     # Display results summary
     successful_scrapes = [r for r in results if r.success]
@@ -359,9 +644,6 @@ if __name__ == "__main__":
             print(f"   Error: {result.error_message}")
         print()
     
-    # Save results
-    scraper.save_results(results)
-    
     # Save only successful results to separate file
     if successful_scrapes:
-        scraper.save_results(successful_scrapes, "successful_scrapes.json")
\ No newline at end of file
+        scraper.save_results(successful_scrapes, "successful_scrapes.jsonl")
\ No newline at end of file
@@ -1,30 +1,110 @@
-from duckduckgo_search import DDGS
-import trafilatura
 import time
 import requests
 from urllib.parse import urlparse, urljoin
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
+from operator import attrgetter
 from typing import List, Dict, Optional, Tuple
 import json
 import csv
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
 import re
 from collections import Counter
-import statistics
+import asyncio
+import aiohttp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    from aiohttp_client_cache import CachedSession as AsyncCachedSession, SQLiteBackend
+    AIOHTTP_CACHE_AVAILABLE = True
+except ImportError:
+    AIOHTTP_CACHE_AVAILABLE = False
+
+try:
+    import aiodns  # noqa: F401 (enables aiohttp.AsyncResolver)
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+# The async fetch connector resolves each host once per DNS_CACHE_TTL seconds instead of per connection
+DNS_CACHE_TTL = 600
+
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?\s*([\w-]+)', re.IGNORECASE)
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('scraping.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _setup_logging(log_file: str = 'scraping.log') -> QueueListener:
+    """
+    Log to log_file and the console. Records are only enqueued on the scraping path; the returned
+    listener's background thread does the file/console I/O and must be stopped when done.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))  # the listener's handlers apply the real format
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    return listener
+
+# Error type for HTTP statuses that identify the failure on their own
+_STATUS_ERRORS = {
+    403: "FORBIDDEN",
+    404: "NOT_FOUND",
+    429: "RATE_LIMITED",
+    503: "SERVICE_UNAVAILABLE",
+}
+
+@lru_cache(maxsize=512)
+def _parse_robots(robots_text: str) -> Tuple[str, ...]:
+    """Disallowed path prefixes that apply to us (User-agent * or mozilla) in a robots.txt body"""
+    disallowed = []
+    user_agent_section = False
+    
+    for line in robots_text.lower().split('\n'):
+        line = line.strip()
+        if line.startswith('user-agent:'):
+            agent = line.split(':', 1)[1].strip()
+            user_agent_section = agent == '*' or 'mozilla' in agent
+        elif user_agent_section and line.startswith('disallow:'):
+            disallowed.append(line.split(':', 1)[1].strip())
+    return tuple(disallowed)
+
+def _extract_main_content(downloaded: str) -> Optional[str]:
+    """Run trafilatura on raw HTML (top-level so it can run in a worker process)"""
+    # Imported on first use: trafilatura pulls in lxml, justext, htmldate and courlan
+    import trafilatura
+    options = dict(
+        include_comments=False,
+        include_tables=True,
+        include_images=False,
+        include_formatting=False
+    )
+    # Fast mode skips the readability/justext fallbacks; they only run for pages it can't handle
+    return (trafilatura.extract(downloaded, fast=True, **options)
+            or trafilatura.extract(downloaded, **options))
+
+@dataclass(slots=True)
 class ScrapingResult:
     url: str
     title: str
@@ -53,7 +133,7 @@ class ScrapingResult:
     timeout_error: bool = False
     connection_error: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingSession:
     query: str
     start_time: datetime
@@ -76,17 +156,53 @@ class ScrapingSession:
             self.results = []
 
 class EnhancedWebScraper:
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    CHUNK_SIZE = 64 * 1024
+    # Client errors no retry or page body can fix; fail fast without downloading the error page
+    UNRECOVERABLE_STATUSES = frozenset({400, 404, 410, 451})
+    
+    def __init__(self, timeout: int = 30, max_retries: int = 3, max_concurrency: int = 10,
+                 max_bytes: int = 2 * 1024 * 1024, cache_name: Optional[str] = None):
         self.timeout = timeout
         self.max_retries = max_retries
-        self.session = requests.Session()
+        self.max_concurrency = max_concurrency
+        # Pages are read in CHUNK_SIZE pieces and cut off after max_bytes; trafilatura never needs more
+        self.max_bytes = max_bytes
+        # trafilatura is CPU-bound; worker processes let extractions overlap each other and the fetches.
+        # Started on the first concurrent extraction and shut down by close()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # Disallowed prefixes per scheme://host (None if robots.txt was unavailable), fetched once per host
+        self._robots_cache: Dict[str, Optional[Tuple[str, ...]]] = {}
+        # Politeness is per host: requests to the same host start at least host_delay seconds apart
+        self.host_delay = 1.0
+        self._host_next: Dict[str, float] = {}
+        # Opt-in: with a cache_name, successful pages are cached on disk for a day so repeated runs skip the network
+        # (requests-cache for this session, aiohttp-client-cache for the concurrent path; both optional).
+        # requests-cache reads a missed response in full before the headers are checked, so only pages
+        # that fetch_with_retries would accept (HTML, within max_bytes) are stored.
+        self.cache_name = cache_name
+        if cache_name and requests_cache:
+            self.session = requests_cache.CachedSession(cache_name, backend='sqlite', expire_after=timedelta(hours=24),
+                                                        allowable_codes=(200,), stale_if_error=True,
+                                                        filter_fn=self._is_cacheable)
+        else:
+            self.session = requests.Session()
+        # Keep-alive pool wide enough for every result host, with urllib3 doing the retries
+        retry = Retry(total=max_retries, backoff_factor=1, status_forcelist=[429, 502, 503, 504],
+                      allowed_methods=['GET', 'HEAD'], respect_retry_after_header=True, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            # gzip/deflate plus br and zstd whenever brotli / zstandard are installed for urllib3 to decode
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
         })
+        # robots.txt is a best-effort check: one attempt, no retry backoff before the real fetch
+        self._robots_session = requests.Session()
+        self._robots_session.headers.update(self.session.headers)
         
         # Common blocking indicators
         self.blocking_indicators = [
@@ -94,6 +210,12 @@ class EnhancedWebScraper:
             'cloudflare', 'bot protection', 'rate limit', 'too many requests',
             'suspicious activity', 'verification required', 'human verification'
         ]
+        # All indicators in one case-insensitive alternation: a single C-level scan of the page
+        self._block_re = re.compile('|'.join(re.escape(indicator) for indicator in self.blocking_indicators),
+                                    re.IGNORECASE)
+        
+        # Links and image mentions are counted together in one case-insensitive pass
+        self._analyze_re = re.compile(r'(?P<links>https?://)|(?P<images>image|photo|picture)', re.IGNORECASE)
         
         # Content quality indicators
         self.quality_indicators = {
@@ -102,43 +224,71 @@ class EnhancedWebScraper:
             'low': ['advertisement', 'popup', 'redirect', 'error']
         }
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Shut down the extraction worker processes and close the HTTP sessions"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self.session.close()
+        self._robots_session.close()
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._pool
+    
+    def _is_cacheable(self, response: requests.Response) -> bool:
+        """requests-cache filter: keep only HTML pages that fit in max_bytes"""
+        return ('text/html' in response.headers.get('content-type', '').lower()
+                and len(response.content) <= self.max_bytes)
+    
+    def _reserve_host_slot(self, url: str) -> float:
+        """Book the next request slot for the URL's host; returns how long to wait for it"""
+        host = urlparse(url).netloc
+        now = time.monotonic()
+        slot = max(now, self._host_next.get(host, 0.0))
+        self._host_next[host] = slot + self.host_delay
+        return slot - now
+    
     def check_robots_txt(self, url: str) -> bool:
         """Check if URL is allowed by robots.txt"""
-        try:
-            parsed_url = urlparse(url)
-            robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
-            
-            response = self.session.get(robots_url, timeout=5)
-            if response.status_code == 200:
-                robots_content = response.text.lower()
-                user_agent_section = False
-                
-                for line in robots_content.split('\n'):
-                    line = line.strip()
-                    if line.startswith('user-agent:'):
-                        agent = line.split(':', 1)[1].strip()
-                        user_agent_section = agent == '*' or 'mozilla' in agent
-                    elif user_agent_section and line.startswith('disallow:'):
-                        disallow_path = line.split(':', 1)[1].strip()
-                        if disallow_path == '/' or parsed_url.path.startswith(disallow_path):
-                            return False
-                return True
-        except:
-            pass
-        return None  # Unknown
+        parsed_url = urlparse(url)
+        host = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        
+        if host not in self._robots_cache:
+            rules = None
+            try:
+                response = self._robots_session.get(f"{host}/robots.txt", timeout=5)
+                if response.status_code == 200:
+                    rules = _parse_robots(response.text)
+            except:
+                pass
+            self._robots_cache[host] = rules
+        
+        rules = self._robots_cache[host]
+        if rules is None:
+            return None  # Unknown
+        return not any(disallow_path == '/' or parsed_url.path.startswith(disallow_path)
+                       for disallow_path in rules)
     
     def detect_blocking(self, content: str, response_headers: dict, status_code: int) -> Tuple[bool, Optional[str]]:
         """Detect if the site is blocking the scraper"""
-        content_lower = content.lower() if content else ""
+        content = content or ""
         
         # Check HTTP status codes
         if status_code in [403, 429, 503]:
             return True, f"HTTP {status_code} error"
         
         # Check content for blocking indicators
-        for indicator in self.blocking_indicators:
-            if indicator in content_lower:
-                return True, f"Content contains: {indicator}"
+        match = self._block_re.search(content)
+        if match:
+            return True, f"Content contains: {match.group(0).lower()}"
         
         # Check headers for blocking
         server = response_headers.get('server', '').lower()
@@ -163,16 +313,26 @@ class EnhancedWebScraper:
         words = len(content.split())
         
         # Count potential links and images (in extracted text)
-        links = content.count('http://') + content.count('https://')
-        images = content.lower().count('image') + content.lower().count('photo') + content.lower().count('picture')
+        counts = Counter(match.lastgroup for match in self._analyze_re.finditer(content))
         
         return {
             'paragraphs': paragraphs,
-            'links': links,
-            'images': images,
+            'links': counts['links'],
+            'images': counts['images'],
             'words': words
         }
     
+    @staticmethod
+    def _decode_body(buf: bytearray, charset: Optional[str]) -> str:
+        """Decode a page once, with the charset from Content-Type, else the <meta charset> in the first 4KB, else UTF-8"""
+        if not charset:
+            match = _META_CHARSET_RE.search(buf, 0, 4096)
+            charset = match.group(1).decode('ascii') if match else 'utf-8'
+        try:
+            return buf.decode(charset, errors='replace')
+        except LookupError:
+            return buf.decode('utf-8', errors='replace')
+    
     def fetch_with_retries(self, url: str) -> Tuple[Optional[str], Dict]:
         """Fetch URL with retry logic and detailed error tracking"""
         metadata = {
@@ -187,38 +347,127 @@ class EnhancedWebScraper:
             'error_message': None
         }
         
+        # Retries with backoff (connection errors, 429/502/503/504) happen inside the mounted adapter
+        try:
+            response = self.session.get(
+                url, 
+                timeout=self.timeout,
+                allow_redirects=True,
+                stream=True
+            )
+            
+            # Collect metadata
+            metadata['http_status'] = response.status_code
+            metadata['content_type'] = response.headers.get('content-type', '')
+            metadata['server_header'] = response.headers.get('server', '')
+            metadata['redirect_count'] = len(response.history)
+            
+            if response.status_code in self.UNRECOVERABLE_STATUSES:
+                response.close()
+                metadata['error_message'] = f"HTTP {response.status_code}"
+                return None, metadata
+            
+            # Check content type (only headers have been read so far)
+            if 'text/html' not in metadata['content_type'].lower():
+                response.close()
+                metadata['error_message'] = f"Non-HTML content: {metadata['content_type']}"
+                return None, metadata
+            
+            # Get content, up to max_bytes
+            buf = bytearray()
+            for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                buf += chunk
+                if len(buf) > self.max_bytes:
+                    break
+            response.close()
+            metadata['response_size'] = len(buf)
+            charset = response.encoding if 'charset' in metadata['content_type'].lower() else None
+            content = self._decode_body(buf, charset)
+            
+            # Check for blocking
+            is_blocked, block_reason = self.detect_blocking(
+                content, response.headers, response.status_code
+            )
+            
+            if is_blocked:
+                metadata['error_message'] = f"Blocked: {block_reason}"
+                return None, metadata
+            
+            return content, metadata
+            
+        except requests.exceptions.SSLError as e:
+            metadata['ssl_error'] = True
+            metadata['error_message'] = f"SSL Error: {str(e)}"
+            logger.warning(f"SSL error for {url}: {str(e)}")
+            
+        except requests.exceptions.Timeout as e:
+            metadata['timeout_error'] = True
+            metadata['error_message'] = f"Timeout: {str(e)}"
+            logger.warning(f"Timeout for {url}: {str(e)}")
+            
+        except requests.exceptions.ConnectionError as e:
+            metadata['connection_error'] = True
+            metadata['error_message'] = f"Connection Error: {str(e)}"
+            logger.warning(f"Connection error for {url}: {str(e)}")
+            
+        except Exception as e:
+            metadata['error_message'] = f"Unexpected error: {str(e)}"
+            logger.error(f"Unexpected error for {url}: {str(e)}")
+        
+        return None, metadata
+    
+    async def _fetch_async(self, session: aiohttp.ClientSession, url: str) -> Tuple[Optional[str], Dict]:
+        """Async counterpart of fetch_with_retries, sharing one aiohttp session across all URLs"""
+        metadata = {
+            'http_status': None,
+            'content_type': None,
+            'server_header': None,
+            'response_size': None,
+            'redirect_count': 0,
+            'ssl_error': False,
+            'timeout_error': False,
+            'connection_error': False,
+            'error_message': None
+        }
+        
         for attempt in range(self.max_retries):
             try:
-                # Add small delay between retries
+                # Add small delay between retries (without holding up the other URLs)
                 if attempt > 0:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
                 
-                response = self.session.get(
-                    url, 
-                    timeout=self.timeout,
-                    allow_redirects=True,
-                    stream=True
-                )
-                
-                # Collect metadata
-                metadata['http_status'] = response.status_code
-                metadata['content_type'] = response.headers.get('content-type', '')
-                metadata['server_header'] = response.headers.get('server', '')
-                metadata['redirect_count'] = len(response.history)
-                
-                # Check content type
-                if 'text/html' not in metadata['content_type'].lower():
-                    metadata['error_message'] = f"Non-HTML content: {metadata['content_type']}"
-                    return None, metadata
-                
-                # Get content
-                content = response.text
-                metadata['response_size'] = len(content)
-                
-                # Check for blocking
-                is_blocked, block_reason = self.detect_blocking(
-                    content, response.headers, response.status_code
-                )
+                async with session.get(url, allow_redirects=True) as response:
+                    # Collect metadata
+                    metadata['http_status'] = response.status
+                    metadata['content_type'] = response.headers.get('content-type', '')
+                    metadata['server_header'] = response.headers.get('server', '')
+                    metadata['redirect_count'] = len(response.history)
+                    
+                    if response.status in self.UNRECOVERABLE_STATUSES:
+                        metadata['error_message'] = f"HTTP {response.status}"
+                        return None, metadata
+                    
+                    # Check content type
+                    if 'text/html' not in metadata['content_type'].lower():
+                        metadata['error_message'] = f"Non-HTML content: {metadata['content_type']}"
+                        return None, metadata
+                    
+                    # Get content, up to max_bytes (a cached page is already in memory)
+                    if getattr(response, 'from_cache', False):
+                        buf = bytearray(await response.read())
+                    else:
+                        buf = bytearray()
+                        async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                            buf += chunk
+                            if len(buf) > self.max_bytes:
+                                break
+                    metadata['response_size'] = len(buf)
+                    content = self._decode_body(buf, response.charset)
+                    
+                    # Check for blocking
+                    is_blocked, block_reason = self.detect_blocking(
+                        content, response.headers, response.status
+                    )
                 
                 if is_blocked:
                     metadata['error_message'] = f"Blocked: {block_reason}"
@@ -226,17 +475,20 @@ class EnhancedWebScraper:
                 
                 return content, metadata
                 
-            except requests.exceptions.SSLError as e:
+            except aiohttp.ClientSSLError as e:
                 metadata['ssl_error'] = True
                 metadata['error_message'] = f"SSL Error: {str(e)}"
                 logger.warning(f"SSL error for {url}: {str(e)}")
+                # An invalid or expired certificate will fail the same way on every attempt
+                if isinstance(e, aiohttp.ClientConnectorCertificateError):
+                    break
                 
-            except requests.exceptions.Timeout as e:
+            except asyncio.TimeoutError as e:
                 metadata['timeout_error'] = True
                 metadata['error_message'] = f"Timeout: {str(e)}"
                 logger.warning(f"Timeout for {url}: {str(e)}")
                 
-            except requests.exceptions.ConnectionError as e:
+            except aiohttp.ClientConnectionError as e:
                 metadata['connection_error'] = True
                 metadata['error_message'] = f"Connection Error: {str(e)}"
                 logger.warning(f"Connection error for {url}: {str(e)}")
@@ -247,8 +499,61 @@ class EnhancedWebScraper:
         
         return None, metadata
     
+    async def _scrape_url_async(self, session: aiohttp.ClientSession, url: str, rank: int, title: str) -> ScrapingResult:
+        """Async counterpart of scrape_url; robots.txt runs in a thread and extraction in the process pool"""
+        start_time = time.time()
+        
+        logger.info(f"Scraping #{rank}: {url}")
+        
+        # Check robots.txt
+        robots_allowed = await asyncio.to_thread(self.check_robots_txt, url)
+        
+        # Fetch the webpage
+        fetch_start = time.time()
+        downloaded, metadata = await self._fetch_async(session, url)
+        fetch_time = time.time() - fetch_start
+        
+        # Only the HTML string crosses the process boundary, not the scraper
+        extracted, extraction_time = None, 0.0
+        if downloaded:
+            extraction_start = time.time()
+            extracted = await asyncio.get_running_loop().run_in_executor(self._get_pool(), _extract_main_content, downloaded)
+            extraction_time = time.time() - extraction_start
+        
+        return self._build_result(url, rank, title, start_time, fetch_time, downloaded, metadata, robots_allowed,
+                                  extracted, extraction_time)
+    
+    def _make_async_session(self, connector: aiohttp.TCPConnector, timeout: aiohttp.ClientTimeout) -> aiohttp.ClientSession:
+        """aiohttp session for the concurrent path, backed by the on-disk cache when available"""
+        # aiohttp advertises the encodings it can decode itself (br / zstd when their decoders are installed)
+        headers = {name: value for name, value in self.session.headers.items() if name.lower() != 'accept-encoding'}
+        if self.cache_name and AIOHTTP_CACHE_AVAILABLE:
+            # Separate file: requests-cache and aiohttp-client-cache use different schemas
+            cache = SQLiteBackend(f"{self.cache_name}_async", expire_after=timedelta(hours=24), allowed_codes=(200,))
+            return AsyncCachedSession(cache=cache, connector=connector, timeout=timeout,
+                                      headers=headers)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers)
+    
+    async def _run(self, search_results: List[Dict]) -> List[ScrapingResult]:
+        """Scrape all search results concurrently, at most max_concurrency at a time, in rank order"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        resolver = aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None
+        connector = aiohttp.TCPConnector(limit=20, resolver=resolver, ttl_dns_cache=DNS_CACHE_TTL)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        async with self._make_async_session(connector, timeout) as session:
+            async def bound(rank: int, result: Dict) -> ScrapingResult:
+                # Wait for the host's slot before taking a concurrency slot; other hosts are unaffected
+                await asyncio.sleep(self._reserve_host_slot(result['href']))
+                async with semaphore:
+                    return await self._scrape_url_async(session, result['href'], rank,
+                                                        result.get('title', 'No title'))
+            
+            return await asyncio.gather(*(bound(i, result) for i, result in enumerate(search_results, 1)))
+    
     def scrape_url(self, url: str, rank: int, title: str) -> ScrapingResult:
         """Scrape a single URL with comprehensive tracking"""
+        time.sleep(self._reserve_host_slot(url))
         start_time = time.time()
         
         logger.info(f"Scraping #{rank}: {url}")
@@ -261,6 +566,20 @@ class EnhancedWebScraper:
         downloaded, metadata = self.fetch_with_retries(url)
         fetch_time = time.time() - fetch_start
         
+        # Extract the main content
+        extracted, extraction_time = None, 0.0
+        if downloaded:
+            extraction_start = time.time()
+            extracted = _extract_main_content(downloaded)
+            extraction_time = time.time() - extraction_start
+        
+        return self._build_result(url, rank, title, start_time, fetch_time, downloaded, metadata, robots_allowed,
+                                  extracted, extraction_time)
+    
+    def _build_result(self, url: str, rank: int, title: str, start_time: float, fetch_time: float,
+                      downloaded: Optional[str], metadata: Dict, robots_allowed: Optional[bool],
+                      extracted: Optional[str], extraction_time: float) -> ScrapingResult:
+        """Analyze an extracted page (or record why the fetch / extraction failed)"""
         if not downloaded:
             return ScrapingResult(
                 url=url,
@@ -291,17 +610,6 @@ class EnhancedWebScraper:
                 connection_error=metadata.get('connection_error', False)
             )
         
-        # Extract the main content
-        extraction_start = time.time()
-        extracted = trafilatura.extract(
-            downloaded,
-            include_comments=False,
-            include_tables=True,
-            include_images=False,
-            include_formatting=False
-        )
-        extraction_time = time.time() - extraction_start
-        
         if not extracted:
             return ScrapingResult(
                 url=url,
@@ -356,24 +664,14 @@ class EnhancedWebScraper:
     
     def _classify_error(self, metadata: Dict) -> str:
         """Classify the type of error"""
-        if metadata.get('ssl_error'):
+        if metadata['ssl_error']:
             return "SSL_ERROR"
-        elif metadata.get('timeout_error'):
+        if metadata['timeout_error']:
             return "TIMEOUT_ERROR"
-        elif metadata.get('connection_error'):
+        if metadata['connection_error']:
             return "CONNECTION_ERROR"
-        elif metadata.get('http_status') == 403:
-            return "FORBIDDEN"
-        elif metadata.get('http_status') == 404:
-            return "NOT_FOUND"
-        elif metadata.get('http_status') == 429:
-            return "RATE_LIMITED"
-        elif metadata.get('http_status') == 503:
-            return "SERVICE_UNAVAILABLE"
-        elif 'blocked' in metadata.get('error_message', '').lower():
-            return "BLOCKED"
-        else:
-            return "UNKNOWN_ERROR"
+        return (_STATUS_ERRORS.get(metadata['http_status'])
+                or ("BLOCKED" if 'blocked' in (metadata['error_message'] or '').lower() else "UNKNOWN_ERROR"))
     
     def scrape_search_results(self, query: str, max_results: int = 10) -> ScrapingSession:
         """Main function to scrape search results with comprehensive analytics"""
@@ -386,7 +684,8 @@ class EnhancedWebScraper:
         logger.info(f"Starting search and scrape session for: '{query}'")
         
         try:
-            # Search DuckDuckGo
+            # Search DuckDuckGo (imported here so importing this module stays cheap)
+            from duckduckgo_search import DDGS
             with DDGS() as ddgs:
                 search_results = [r for r in ddgs.text(query, max_results=max_results)]
             
@@ -395,18 +694,22 @@ class EnhancedWebScraper:
                 session.end_time = datetime.now()
                 return session
             
-            # Process each URL
-            for i, result in enumerate(search_results, 1):
-                url = result['href']
-                title = result.get('title', 'No title')
-                
-                scrape_result = self.scrape_url(url, i, title)
+            # Timing statistics are accumulated in the same pass as the counters
+            total_time_sum, fastest_time, slowest_time = 0.0, float('inf'), -1.0
+            
+            # Fetch every URL concurrently, then record the results in rank order
+            for scrape_result in asyncio.run(self._run(search_results)):
                 session.results.append(scrape_result)
                 
                 # Update session statistics
                 if scrape_result.success:
                     session.successful_scrapes += 1
                     session.total_words_extracted += scrape_result.word_count
+                    total_time_sum += scrape_result.total_time
+                    if scrape_result.total_time < fastest_time:
+                        fastest_time, session.fastest_site = scrape_result.total_time, scrape_result.url
+                    if scrape_result.total_time > slowest_time:
+                        slowest_time, session.slowest_site = scrape_result.total_time, scrape_result.url
                     logger.info(f"✅ Success - {scrape_result.word_count} words extracted in {scrape_result.total_time:.2f}s")
                 else:
                     session.failed_scrapes += 1
@@ -420,26 +723,14 @@ class EnhancedWebScraper:
                         session.ssl_errors += 1
                     
                     logger.warning(f"❌ Failed - {scrape_result.error_type}: {scrape_result.error_message}")
-                
-                # Add small delay between requests
-                time.sleep(1)
+            
+            if session.successful_scrapes:
+                session.average_fetch_time = total_time_sum / session.successful_scrapes
         
         except Exception as e:
             logger.error(f"Search failed: {str(e)}")
         
-        # Calculate final statistics
         session.end_time = datetime.now()
-        if session.results:
-            fetch_times = [r.total_time for r in session.results if r.success]
-            if fetch_times:
-                session.average_fetch_time = statistics.mean(fetch_times)
-                fastest = min(session.results, key=lambda x: x.total_time if x.success else float('inf'))
-                slowest = max(session.results, key=lambda x: x.total_time if x.success else 0)
-                if fastest.success:
-                    session.fastest_site = fastest.url
-                if slowest.success:
-                    session.slowest_site = slowest.url
-        
         return session
     
     def print_detailed_report(self, session: ScrapingSession):
@@ -509,43 +800,56 @@ class EnhancedWebScraper:
         
         if 'json' in formats:
             json_file = f"{base_filename}.json"
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'session_info': asdict(session),
-                    'results': [asdict(result) for result in session.results]
-                }, f, indent=2, ensure_ascii=False, default=str)
+            if orjson:
+                # orjson serializes the dataclasses and datetimes natively, without asdict() copies
+                with open(json_file, 'wb') as f:
+                    f.write(orjson.dumps({
+                        'session_info': session,
+                        'results': session.results
+                    }, option=orjson.OPT_INDENT_2))
+            else:
+                with open(json_file, 'w', encoding='utf-8') as f:
+                    json.dump({
+                        'session_info': asdict(session),
+                        'results': [asdict(result) for result in session.results]
+                    }, f, indent=2, ensure_ascii=False, default=str)
             logger.info(f"Results saved to {json_file}")
         
         if 'csv' in formats:
             csv_file = f"{base_filename}.csv"
             with open(csv_file, 'w', newline='', encoding='utf-8') as f:
                 if session.results:
-                    writer = csv.DictWriter(f, fieldnames=asdict(session.results[0]).keys())
-                    writer.writeheader()
-                    for result in session.results:
-                        writer.writerow(asdict(result))
+                    # Rows straight from the attributes; article bodies stay in the JSON file only
+                    names = [field.name for field in fields(ScrapingResult) if field.name != 'content']
+                    row = attrgetter(*names)
+                    writer = csv.writer(f)
+                    writer.writerow(names)
+                    writer.writerows(map(row, session.results))
             logger.info(f"Results saved to {csv_file}")
 
 # Example usage
 if __name__ == "__main__":
-    # Initialize the enhanced scraper
-    scraper = EnhancedWebScraper(timeout=30, max_retries=2)
-    
-    # Define your search query
-    query = "Best Earbud in BD 2025"
-    
-    # Run the comprehensive scraping session
-    session = scraper.scrape_search_results(query, max_results=10)
-    
-    # Print detailed report
-    scraper.print_detailed_report(session)
-    
-    # Save results
-    scraper.save_results(session, formats=['json', 'csv'])
+    log_listener = _setup_logging()
+    try:
+        # Initialize the enhanced scraper (closing it stops the extraction worker processes)
+        with EnhancedWebScraper(timeout=30, max_retries=2) as scraper:
+            # Define your search query
+            query = "Best Earbud in BD 2025"
+        
+            # Run the comprehensive scraping session
+            session = scraper.scrape_search_results(query, max_results=10)
+        
+            # Print detailed report
+            scraper.print_detailed_report(session)
+        
+            # Save results
+            scraper.save_results(session, formats=['json', 'csv'])
     
-    # Print summary statistics
-    if session.successful_scrapes > 0:
-        success_rate = (session.successful_scrapes / session.total_urls) * 100
-        avg_words = session.total_words_extracted / session.successful_scrapes
-        print(f"\n🎯 SUCCESS RATE: {success_rate:.1f}%")
-        print(f"📊 AVERAGE WORDS PER SUCCESSFUL SCRAPE: {avg_words:.0f}")
\ No newline at end of file
+        # Print summary statistics
+        if session.successful_scrapes > 0:
+            success_rate = (session.successful_scrapes / session.total_urls) * 100
+            avg_words = session.total_words_extracted / session.successful_scrapes
+            print(f"\n🎯 SUCCESS RATE: {success_rate:.1f}%")
+            print(f"📊 AVERAGE WORDS PER SUCCESSFUL SCRAPE: {avg_words:.0f}")
+    finally:
+        log_listener.stop()
@@ -1,46 +1,188 @@
 import trafilatura
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import aiohttp
+import httpx
+import os
+from concurrent.futures import ThreadPoolExecutor
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import urlparse
+from functools import lru_cache
+import threading
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import sys
 import time
 import re
 
 try:
-    from playwright.sync_api import sync_playwright
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+try:
+    import h2  # noqa: F401 (enables httpx HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+def _setup_logging():
+    """
+    Progress messages are only enqueued on the scraping path (concurrent tasks never wait on stdout);
+    the returned listener's background thread writes them out in the same plain format the old prints used.
+    Stopping the listener writes out everything still queued.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+    return listener
+
+# Candidate pages are fetched concurrently, at most FETCH_PER_HOST connections per host
+FETCH_TIMEOUT = 15
+FETCH_PER_HOST = 2
+# Extractors keep at most ~1500 characters, so a page is never downloaded past MAX_BODY_BYTES
+MAX_BODY_BYTES = 1_000_000
+CHUNK_SIZE = 64 * 1024
+# trafilatura's downloader blocks; its own pool means asyncio.run never waits on a cancelled fallback
+_FALLBACK_POOL = ThreadPoolExecutor(max_workers=5)
+
+# One keep-alive connection pool shared by the SearXNG and DuckDuckGo searches.
+# Both are form POSTs, so retries are allowed for any method; a refused connection
+# (local SearXNG not running) is not retried so the DuckDuckGo fallback starts at once.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                       max_retries=Retry(total=2, connect=0, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                                         allowed_methods=None, raise_on_status=False))
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+})
+
+# Optional remote JS rendering service (e.g. browserless' /content endpoint: POST {"url": ...} -> HTML).
+# When set, JS-heavy fallbacks are rendered there concurrently over one HTTP/2 connection
+# instead of one by one in the local Playwright browser.
+RENDER_SERVICE_URL = os.getenv("RENDER_SERVICE_URL")
+RENDER_TIMEOUT = 30
+
+# One headless Chromium is started on first use and kept for the rest of the process;
+# each scrape gets its own lightweight BrowserContext instead of a fresh browser launch.
+# Playwright's sync objects belong to the thread that started them, the lock only guards start-up.
+_PLAYWRIGHT = None
+_BROWSER = None
+_BROWSER_LOCK = threading.Lock()
+# Only the DOM is read, so these subresources are never downloaded
+_BLOCKED_RESOURCES = {"image", "media", "font", "stylesheet"}
+
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?\s*([\w-]+)', re.IGNORECASE)
+
+# Selector lists tried in priority order, built once instead of on every extraction
+_AMAZON_PRICE_SELECTORS = (".a-price-whole", ".a-price .a-offscreen", "#priceblock_dealprice", "#priceblock_ourprice")
+_AMAZON_IMPORTANT_SPECS = ("brand", "model", "color", "size", "weight", "material", "dimensions")
+_AMAZON_SPEC_TABLES = ("#productDetails_techSpec_section_1", "#productDetails_detailBullets_sections1")
+_FORUM_TITLE_SELECTORS = ("h1", ".title", "[data-testid='post-content'] h1")
+_FORUM_CONTENT_SELECTORS = (".post-text", "[data-testid='post-content'] div", ".usertext-body")
+_FORUM_ANSWER_SELECTORS = (".answer .post-text", ".comment-body", ".reply .usertext-body")
+_VIDEO_TITLE_SELECTORS = ("h1", ".title", "[name='title']")
+_VIDEO_DESC_SELECTORS = (".description", "[name='description']", ".content")
+_GENERIC_CONTENT_SELECTORS = (
+    "article", "main", ".content", ".post-content",
+    ".entry-content", ".article-content", "#content",
+    ".main-content", ".page-content", ".site-content"
+)
+# Paragraphs mentioning any of these are boilerplate, not content
+_SKIP_WORDS = ('cookie', 'privacy', 'terms', 'subscribe', 'newsletter', 'login', 'register')
+# Navigation/footer/sidebar blocks dropped before the generic paragraph fallback:
+# whole tags in one strip_tags() pass, then the class-matched remainder
+_UNWANTED_TAGS = ["nav", "footer", "aside"]
+_UNWANTED_SELECTOR = ".nav, .footer, .sidebar, .menu, .header, .advertisement, .ads"
+# Subtrees no extractor reads (bs4's get_text() already skipped script/style/template text);
+# dropping them right after parsing keeps every later selector and text() walk off those nodes
+_UNUSED_TAGS = ["script", "style", "template", "svg", "noscript", "iframe", "object", "embed", "canvas"]
+
+_CRUFT_RE = re.compile(r'(cookie|privacy policy|terms of service|subscribe|newsletter)', re.IGNORECASE)
+
+# Important details (prices, specs, features, etc.), labelled by each pattern's first keyword
+_DETAIL_PATTERNS = [
+    r'(?:price|cost|₹|rs\.?|usd|\$)\s*:?\s*([0-9,]+(?:\.[0-9]+)?)',
+    r'(?:mileage|efficiency|mpg|kmpl)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
+    r'(?:power|hp|bhp|kw)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
+    r'(?:engine|displacement|cc)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
+    r'(?:weight|mass|kg|pounds)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
+    r'(?:features?|specifications?|specs?)\s*:?\s*([a-zA-Z0-9\s,.-]+)'
+]
+_DETAIL_RES = [(pattern.split('|')[0].replace('(?:', '').replace('\\', ''), re.compile(pattern, re.IGNORECASE))
+               for pattern in _DETAIL_PATTERNS]
+
+@lru_cache(maxsize=4096)
 def get_domain(url):
-    return urlparse(url).netloc.lower().replace('www.', '')
+    return urlparse(url).netloc.lower().removeprefix('www.')
+
+def _decode_html(html, charset=None):
+    """lexbor only reads UTF-8, so bytes are decoded with the HTTP charset or the page's <meta charset> first"""
+    if isinstance(html, str):
+        return html
+    if not charset:
+        match = _META_CHARSET_RE.search(html, 0, 4096)
+        charset = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        return html.decode(charset, errors='replace')
+    except LookupError:
+        return html.decode('utf-8', errors='replace')
+
+def _next_element(node):
+    """Next sibling element, skipping text and comment nodes (like bs4's find_next_sibling)"""
+    node = node.next
+    while node is not None and not node.is_element_node:
+        node = node.next
+    return node
+
+def _has_skip_word(text):
+    """True for boilerplate paragraphs (cookie banners, login prompts, ...)"""
+    lowered = text.lower()
+    return any(word in lowered for word in _SKIP_WORDS)
+
+def _truncate(text, limit):
+    """First limit characters of text, with '...' appended when something was cut"""
+    return text[:limit] + "..." if len(text) > limit else text
 
 def clean_text(text):
     """Clean and normalize text content"""
     if not text:
         return ""
     # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text.strip())
+    # str.split() uses exactly the whitespace set of regex \s, without going through the regex engine
+    text = ' '.join(text.split())
     # Remove common web cruft
-    text = re.sub(r'(cookie|privacy policy|terms of service|subscribe|newsletter)', '', text, flags=re.IGNORECASE)
+    text = _CRUFT_RE.sub('', text)
     return text
 
 def scrape_searxng_local(query, max_results=10):
     """Search using local SearXNG instance"""
     url = "http://localhost:8888/search"
     data = {"q": query, "format": "json"}
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Content-Type": "application/x-www-form-urlencoded"
-    }
     
     try:
-        print(f"Searching SearXNG for: '{query}'")
-        response = requests.post(url, data=data, headers=headers, timeout=15)
+        logger.info(f"Searching SearXNG for: '{query}'")
+        # requests form-encodes the dict and sets Content-Type itself
+        response = _SESSION.post(url, data=data, timeout=15)
         response.raise_for_status()
         search_results = response.json()
         
         if not search_results.get('results'):
-            print("No results found in SearXNG response")
+            logger.warning("No results found in SearXNG response")
             return []
         
         results = []
@@ -71,54 +213,55 @@ def scrape_searxng_local(query, max_results=10):
                 'body': content
             })
             
-        print(f"Found {len(results)} unique results from SearXNG")
+        logger.info(f"Found {len(results)} unique results from SearXNG")
         return results
         
     except requests.exceptions.HTTPError as e:
-        print(f"[SearXNG] HTTP error for '{query}': {e}")
+        logger.warning(f"[SearXNG] HTTP error for '{query}': {e}")
         return []
     except requests.exceptions.RequestException as e:
-        print(f"[SearXNG] Connection error for '{query}': {e}")
+        logger.warning(f"[SearXNG] Connection error for '{query}': {e}")
         return []
     except Exception as e:
-        print(f"[SearXNG] Unexpected error for '{query}': {e}")
+        logger.warning(f"[SearXNG] Unexpected error for '{query}': {e}")
         return []
 
 def scrape_duckduckgo_html(query, max_results=10):
     """Scrape DuckDuckGo HTML to get search results (fallback)"""
     url = "https://html.duckduckgo.com/html/"
-    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
     params = {'q': query}
     
     try:
         time.sleep(1)
-        response = requests.post(url, data=params, headers=headers, timeout=15)
+        response = _SESSION.post(url, data=params, timeout=15)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # requests reports ISO-8859-1 for a charset-less text/html, which would skip the <meta charset> sniff
+        charset = response.encoding if 'charset' in response.headers.get('Content-Type', '').lower() else None
+        tree = LexborHTMLParser(_decode_html(response.content, charset))
         
         results = []
         seen_domains = set()
-        result_containers = soup.find_all('div', class_='result')
+        result_containers = tree.css('div.result')
         
         for container in result_containers:
             if len(results) >= max_results:
                 break
                 
-            url_tag = container.find('a', class_='result__url')
-            if not url_tag or not url_tag.get('href'):
+            url_tag = container.css_first('a.result__url')
+            if not url_tag or not url_tag.attributes.get('href'):
                 continue
                 
-            href = url_tag['href']
+            href = url_tag.attributes['href']
             domain = get_domain(href)
             if domain in seen_domains:
                 continue
             seen_domains.add(domain)
             
-            title_tag = container.find('h2', class_='result__title')
-            title = title_tag.get_text().strip() if title_tag else "No title available"
+            title_tag = container.css_first('h2.result__title')
+            title = title_tag.text().strip() if title_tag else "No title available"
             
-            snippet_tag = container.find('a', class_='result__snippet')
-            body = snippet_tag.get_text().strip() if snippet_tag else "No description available"
+            snippet_tag = container.css_first('a.result__snippet')
+            body = snippet_tag.text().strip() if snippet_tag else "No description available"
             
             results.append({
                 'title': title,
@@ -129,42 +272,25 @@ def scrape_duckduckgo_html(query, max_results=10):
         return results
         
     except Exception as e:
-        print(f"[DDG HTML scrape] failed for '{query}': {e}")
+        logger.warning(f"[DDG HTML scrape] failed for '{query}': {e}")
         return []
 
 def extract_smart_content(html, url):
     """Extract only the most important content based on site type and structure"""
-    soup = BeautifulSoup(html, "lxml")
+    tree = LexborHTMLParser(_decode_html(html))
+    tree.strip_tags(_UNUSED_TAGS)
     result = {
         "url": url,
-        "domain": get_domain(url),
-        "title": "",
-        "main_content": "",
-        "key_points": [],
-        "metadata": {}
+        "domain": get_domain(url)
     }
     
-    # Extract title
-    title_tag = soup.find('title')
-    if title_tag:
-        result["title"] = clean_text(title_tag.get_text())
-    
-    # Site-specific extraction
-    if "amazon." in url:
-        return extract_amazon_smart(soup, url)
-    elif any(domain in url for domain in ["reddit.com", "stackoverflow.com", "github.com"]):
-        return extract_forum_smart(soup, url)
-    elif any(domain in url for domain in ["wikipedia.org", "britannica.com"]):
-        return extract_wiki_smart(soup, url)
-    elif any(domain in url for domain in ["youtube.com", "vimeo.com"]):
-        return extract_video_smart(soup, url)
-    else:
-        return extract_generic_smart(soup, url)
+    # Site-specific extraction fills in the rest of the result
+    _extractor_for(result["domain"])(tree, url, result)
+    return result
 
-def extract_amazon_smart(soup, url):
+def extract_amazon_smart(tree, url, result):
     """Extract key Amazon product information"""
-    result = {
-        "url": url,
+    result.update({
         "domain": "amazon",
         "type": "product",
         "title": "",
@@ -173,241 +299,220 @@ def extract_amazon_smart(soup, url):
         "key_features": [],
         "description": "",
         "specs": {}
-    }
+    })
     
     # Product title
-    title = soup.find(id="productTitle")
+    title = tree.css_first("#productTitle")
     if title:
-        result["title"] = clean_text(title.get_text())
+        result["title"] = clean_text(title.text())
     
     # Price
-    price_selectors = [
-        ".a-price-whole",
-        ".a-price .a-offscreen",
-        "#priceblock_dealprice",
-        "#priceblock_ourprice"
-    ]
-    for selector in price_selectors:
-        price = soup.select_one(selector)
+    for selector in _AMAZON_PRICE_SELECTORS:
+        price = tree.css_first(selector)
         if price:
-            result["price"] = clean_text(price.get_text())
+            result["price"] = clean_text(price.text())
             break
     
     # Rating
-    rating = soup.select_one("[data-hook='average-star-rating'] .a-icon-alt")
+    rating = tree.css_first("[data-hook='average-star-rating'] .a-icon-alt")
     if rating:
-        result["rating"] = clean_text(rating.get_text())
+        result["rating"] = clean_text(rating.text())
     
     # Key features (limit to top 5)
-    bullets = soup.select("#feature-bullets ul li span")
+    bullets = tree.css("#feature-bullets ul li span")
     if bullets:
-        result["key_features"] = [clean_text(b.get_text()) for b in bullets[:5] if clean_text(b.get_text())]
+        features = (clean_text(b.text()) for b in bullets[:5])
+        result["key_features"] = [feature for feature in features if feature]
     
     # Description (first paragraph only)
-    desc = soup.find(id="productDescription")
+    desc = tree.css_first("#productDescription")
     if desc:
-        desc_text = clean_text(desc.get_text())
+        desc_text = clean_text(desc.text())
         # Take only first 500 characters
-        result["description"] = desc_text[:500] + "..." if len(desc_text) > 500 else desc_text
+        result["description"] = _truncate(desc_text, 500)
     
     # Key specs only (limit to most important ones)
-    important_specs = ["Brand", "Model", "Color", "Size", "Weight", "Material", "Dimensions"]
-    for table_id in ["productDetails_techSpec_section_1", "productDetails_detailBullets_sections1"]:
-        table = soup.find(id=table_id)
+    for table_selector in _AMAZON_SPEC_TABLES:
+        table = tree.css_first(table_selector)
         if table:
-            for row in table.find_all("tr"):
-                th = row.find("th")
-                td = row.find("td")
+            for row in table.css("tr"):
+                th = row.css_first("th")
+                td = row.css_first("td")
                 if th and td:
-                    spec_name = clean_text(th.get_text())
-                    if any(imp_spec.lower() in spec_name.lower() for imp_spec in important_specs):
-                        result["specs"][spec_name] = clean_text(td.get_text())
+                    spec_name = clean_text(th.text())
+                    spec_name_lower = spec_name.lower()
+                    if any(imp_spec in spec_name_lower for imp_spec in _AMAZON_IMPORTANT_SPECS):
+                        result["specs"][spec_name] = clean_text(td.text())
     
     return result
 
-def extract_forum_smart(soup, url):
+def extract_forum_smart(tree, url, result):
     """Extract key information from forum/discussion sites"""
-    result = {
-        "url": url,
-        "domain": get_domain(url),
+    result.update({
         "type": "forum",
         "title": "",
         "question": "",
         "top_answers": [],
         "tags": []
-    }
+    })
     
     # Title
-    title_selectors = ["h1", ".title", "[data-testid='post-content'] h1"]
-    for selector in title_selectors:
-        title = soup.select_one(selector)
+    for selector in _FORUM_TITLE_SELECTORS:
+        title = tree.css_first(selector)
         if title:
-            result["title"] = clean_text(title.get_text())
+            result["title"] = clean_text(title.text())
             break
     
     # Question/main content
-    content_selectors = [".post-text", "[data-testid='post-content'] div", ".usertext-body"]
-    for selector in content_selectors:
-        content = soup.select_one(selector)
+    for selector in _FORUM_CONTENT_SELECTORS:
+        content = tree.css_first(selector)
         if content:
-            content_text = clean_text(content.get_text())
-            result["question"] = content_text[:800] + "..." if len(content_text) > 800 else content_text
+            content_text = clean_text(content.text())
+            result["question"] = _truncate(content_text, 800)
             break
     
     # Top answers (limit to 2)
-    answer_selectors = [".answer .post-text", ".comment-body", ".reply .usertext-body"]
-    for selector in answer_selectors:
-        answers = soup.select(selector)
+    for selector in _FORUM_ANSWER_SELECTORS:
+        answers = tree.css(selector)
         if answers:
-            result["top_answers"] = [clean_text(ans.get_text())[:400] + "..." if len(clean_text(ans.get_text())) > 400 else clean_text(ans.get_text()) for ans in answers[:2]]
+            result["top_answers"] = [_truncate(clean_text(ans.text()), 400) for ans in answers[:2]]
             break
     
     return result
 
-def extract_wiki_smart(soup, url):
+def extract_wiki_smart(tree, url, result):
     """Extract key information from Wikipedia-style sites"""
-    result = {
-        "url": url,
-        "domain": get_domain(url),
+    result.update({
         "type": "encyclopedia",
         "title": "",
         "summary": "",
         "key_sections": []
-    }
+    })
     
     # Title
-    title = soup.find('h1')
+    title = tree.css_first('h1')
     if title:
-        result["title"] = clean_text(title.get_text())
+        result["title"] = clean_text(title.text())
     
     # Summary (first paragraph)
-    first_p = soup.select_one("p")
+    first_p = tree.css_first("p")
     if first_p:
-        summary_text = clean_text(first_p.get_text())
-        result["summary"] = summary_text[:600] + "..." if len(summary_text) > 600 else summary_text
+        summary_text = clean_text(first_p.text())
+        result["summary"] = _truncate(summary_text, 600)
     
     # Key sections (first 3 h2 sections)
-    sections = soup.select("h2")
+    sections = tree.css("h2")
     for section in sections[:3]:
-        section_title = clean_text(section.get_text())
+        section_title = clean_text(section.text())
         if section_title and not any(skip in section_title.lower() for skip in ["reference", "external", "see also"]):
             result["key_sections"].append(section_title)
     
     return result
 
-def extract_video_smart(soup, url):
+def extract_video_smart(tree, url, result):
     """Extract key information from video sites"""
-    result = {
-        "url": url,
-        "domain": get_domain(url),
+    result.update({
         "type": "video",
         "title": "",
         "description": "",
         "duration": "",
         "views": ""
-    }
+    })
     
     # Title
-    title_selectors = ["h1", ".title", "[name='title']"]
-    for selector in title_selectors:
-        title = soup.select_one(selector)
+    for selector in _VIDEO_TITLE_SELECTORS:
+        title = tree.css_first(selector)
         if title:
-            result["title"] = clean_text(title.get_text())
+            result["title"] = clean_text(title.text())
             break
     
     # Description (first 300 chars)
-    desc_selectors = [".description", "[name='description']", ".content"]
-    for selector in desc_selectors:
-        desc = soup.select_one(selector)
+    for selector in _VIDEO_DESC_SELECTORS:
+        desc = tree.css_first(selector)
         if desc:
-            desc_text = clean_text(desc.get_text())
-            result["description"] = desc_text[:300] + "..." if len(desc_text) > 300 else desc_text
+            desc_text = clean_text(desc.text())
+            result["description"] = _truncate(desc_text, 300)
             break
     
     return result
 
-def extract_generic_smart(soup, url):
+def extract_generic_smart(tree, url, result):
     """Extract key information from generic websites"""
-    result = {
-        "url": url,
-        "domain": get_domain(url),
+    result.update({
         "type": "generic",
         "title": "",
         "main_content": "",
         "key_sections": [],
         "important_details": [],
         "summary": ""
-    }
+    })
     
     # Title
-    title = soup.find('title')
+    title = tree.css_first('title')
     if title:
-        result["title"] = clean_text(title.get_text())
+        result["title"] = clean_text(title.text())
     
     # Try to get a summary from meta description
-    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    meta_desc = tree.css_first("meta[name='description']")
     if meta_desc:
-        result["summary"] = clean_text(meta_desc.get('content', ''))
+        result["summary"] = clean_text(meta_desc.attributes.get('content') or '')
     
     # Main content areas (prioritize article, main, or content divs)
-    content_selectors = [
-        "article", "main", ".content", ".post-content", 
-        ".entry-content", ".article-content", "#content",
-        ".main-content", ".page-content", ".site-content"
-    ]
-    
     main_content_found = False
-    for selector in content_selectors:
-        content = soup.select_one(selector)
+    for selector in _GENERIC_CONTENT_SELECTORS:
+        content = tree.css_first(selector)
         if content:
-            content_text = clean_text(content.get_text())
+            content_text = clean_text(content.text())
             if len(content_text) > 100:  # Ensure substantial content
                 # Limit to first 1500 characters for more comprehensive info
-                result["main_content"] = content_text[:1500] + "..." if len(content_text) > 1500 else content_text
+                result["main_content"] = _truncate(content_text, 1500)
                 main_content_found = True
                 break
     
     # If no main content found, get body content but filter out navigation/footer
     if not main_content_found:
-        # Remove navigation, footer, sidebar elements
-        for unwanted in soup.select('nav, footer, aside, .nav, .footer, .sidebar, .menu, .header, .advertisement, .ads'):
+        # Remove navigation, footer, sidebar elements (innermost first: lexbor frees a node's whole subtree)
+        tree.strip_tags(_UNWANTED_TAGS)
+        for unwanted in reversed(tree.css(_UNWANTED_SELECTOR)):
             unwanted.decompose()
         
         # Get all paragraphs and list items
-        content_elements = soup.select("p, li, div.description, div.summary, .info, .details")
+        content_elements = tree.css("p, li, div.description, div.summary, .info, .details")
         content_texts = []
+        joined_length = -1  # length of " ".join(content_texts)
         
         for elem in content_elements:
-            text = clean_text(elem.get_text())
-            if len(text) > 20 and not any(skip in text.lower() for skip in 
-                ['cookie', 'privacy', 'terms', 'subscribe', 'newsletter', 'login', 'register']):
+            text = clean_text(elem.text())
+            if len(text) > 20 and not _has_skip_word(text):
                 content_texts.append(text)
+                joined_length += len(text) + 1
+                # Only the first 1500 characters are kept; once past them the rest of the page is irrelevant
+                if joined_length > 1500:
+                    break
         
         if content_texts:
             combined_text = " ".join(content_texts)
-            result["main_content"] = combined_text[:1500] + "..." if len(combined_text) > 1500 else combined_text
+            result["main_content"] = _truncate(combined_text, 1500)
     
     # Extract key sections with their content
-    headings = soup.select("h1, h2, h3")
+    headings = tree.css("h1, h2, h3")
     for heading in headings[:6]:  # Top 6 headings
-        heading_text = clean_text(heading.get_text())
+        heading_text = clean_text(heading.text())
         if heading_text and len(heading_text) > 3:
             # Find content after this heading
             section_content = []
-            current = heading.find_next_sibling()
+            current = _next_element(heading)
             
-            while current and current.name not in ['h1', 'h2', 'h3'] and len(section_content) < 3:
-                if current.name in ['p', 'div', 'ul', 'ol']:
-                    text = clean_text(current.get_text())
+            while current and current.tag not in ['h1', 'h2', 'h3'] and len(section_content) < 3:
+                if current.tag in ['p', 'div', 'ul', 'ol']:
+                    text = clean_text(current.text())
                     if len(text) > 20:
                         section_content.append(text)
-                current = current.find_next_sibling()
+                current = _next_element(current)
             
             if section_content:
-                section_text = " ".join(section_content)
                 # Limit each section to 300 characters
-                if len(section_text) > 300:
-                    section_text = section_text[:300] + "..."
+                section_text = _truncate(" ".join(section_content), 300)
                 
                 result["key_sections"].append({
                     "heading": heading_text,
@@ -415,33 +520,23 @@ def extract_generic_smart(soup, url):
                 })
     
     # Extract important details (prices, specs, features, etc.)
-    detail_patterns = [
-        r'(?:price|cost|₹|rs\.?|usd|\$)\s*:?\s*([0-9,]+(?:\.[0-9]+)?)',
-        r'(?:mileage|efficiency|mpg|kmpl)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
-        r'(?:power|hp|bhp|kw)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
-        r'(?:engine|displacement|cc)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
-        r'(?:weight|mass|kg|pounds)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
-        r'(?:features?|specifications?|specs?)\s*:?\s*([a-zA-Z0-9\s,.-]+)'
-    ]
-    
     full_text = result["main_content"] + " " + " ".join([section["content"] for section in result["key_sections"]])
     
-    for pattern in detail_patterns:
-        matches = re.findall(pattern, full_text, re.IGNORECASE)
-        if matches:
-            detail_type = pattern.split('|')[0].replace('(?:', '').replace('\\', '')
-            result["important_details"].append(f"{detail_type}: {matches[0]}")
+    for detail_type, pattern in _DETAIL_RES:
+        match = pattern.search(full_text)
+        if match:
+            result["important_details"].append(f"{detail_type}: {match.group(1)}")
     
     # If we still don't have good content, try table data
     if len(result["main_content"]) < 200:
-        tables = soup.select("table")
+        tables = tree.css("table")
         table_data = []
         for table in tables[:2]:  # Max 2 tables
-            rows = table.select("tr")
+            rows = table.css("tr")
             for row in rows[:5]:  # Max 5 rows per table
-                cells = row.select("td, th")
+                cells = row.css("td, th")
                 if len(cells) >= 2:
-                    row_text = " | ".join([clean_text(cell.get_text()) for cell in cells])
+                    row_text = " | ".join([clean_text(cell.text()) for cell in cells])
                     if len(row_text) > 10:
                         table_data.append(row_text)
         
@@ -450,69 +545,201 @@ def extract_generic_smart(soup, url):
     
     return result
 
-def try_scrape_smart(url):
+# Site-specific extractors, keyed by site domain; "amazon" matches any amazon.<tld> storefront
+_SITE_EXTRACTORS = {
+    "amazon": extract_amazon_smart,
+    "reddit.com": extract_forum_smart,
+    "stackoverflow.com": extract_forum_smart,
+    "github.com": extract_forum_smart,
+    "wikipedia.org": extract_wiki_smart,
+    "britannica.com": extract_wiki_smart,
+    "youtube.com": extract_video_smart,
+    "vimeo.com": extract_video_smart,
+}
+
+@lru_cache(maxsize=1024)
+def _extractor_for(domain):
+    """Extractor for a domain or any of its parent domains (en.wikipedia.org -> wikipedia.org), else the generic one"""
+    labels = domain.split('.')
+    for i in range(len(labels) - 1):
+        extractor = _SITE_EXTRACTORS.get('.'.join(labels[i:])) or _SITE_EXTRACTORS.get(labels[i])
+        if extractor:
+            return extractor
+    return extract_generic_smart
+
+def _trafilatura_smart(url):
+    """Blocking trafilatura download + smart extraction, the fallback when the direct fetch gives nothing"""
+    downloaded = trafilatura.fetch_url(url)
+    if downloaded:
+        extracted = trafilatura.extract(downloaded)
+        if extracted and len(extracted.strip()) > 30:
+            # For trafilatura, we still do smart extraction from the HTML
+            return extract_smart_content(downloaded, url)
+    return None
+
+async def _read_capped(resp):
+    """Reads an aiohttp response body up to MAX_BODY_BYTES"""
+    chunks = []
+    total = 0
+    async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= MAX_BODY_BYTES:
+            break
+    return b''.join(chunks)[:MAX_BODY_BYTES]
+
+async def _fetch_and_extract(session, url):
     """Try to scrape with smart content extraction"""
     scrape_start = time.time()
-    print(f"  Attempting to scrape: {url}")
+    logger.info(f"  Attempting to scrape: {url}")
     
-    # Try requests + smart extraction first (better for HTML parsing)
-    print(f"    Trying requests + smart extraction...")
+    # Try aiohttp + smart extraction first (better for HTML parsing)
+    logger.info(f"    Trying aiohttp + smart extraction...")
     try:
-        resp = requests.get(url, timeout=15, headers={"User-Agent": "Mozilla/5.0"})
-        if resp.ok:
-            smart_content = extract_smart_content(resp.text, url)
-            if smart_content and (smart_content.get("main_content") or smart_content.get("key_sections")):
-                scrape_time = time.time() - scrape_start
-                print(f"    ✓ Success with requests+smart ({scrape_time:.2f}s)")
-                return {"url": url, "method": "requests+smart", "content": smart_content}
+        async with session.get(url, headers={"User-Agent": "Mozilla/5.0"}) as resp:
+            content_type = resp.headers.get("Content-Type", "")
+            if content_type and "html" not in content_type:
+                # A PDF or image would not get any better through the trafilatura fallback
+                logger.warning(f"    ✗ Not an HTML page ({content_type})")
+                return None
+            if resp.ok:
+                body = await _read_capped(resp)
+                smart_content = extract_smart_content(_decode_html(body, resp.charset), url)
+                if smart_content and (smart_content.get("main_content") or smart_content.get("key_sections")):
+                    scrape_time = time.time() - scrape_start
+                    logger.info(f"    ✓ Success with aiohttp+smart ({scrape_time:.2f}s)")
+                    return {"url": url, "method": "aiohttp+smart", "content": smart_content}
     except Exception as e:
-        print(f"    ✗ Requests failed: {e}")
+        logger.warning(f"    ✗ Request failed: {e}")
     
     # Try trafilatura as fallback
-    print(f"    Trying trafilatura...")
-    downloaded = trafilatura.fetch_url(url)
-    if downloaded:
-        extracted = trafilatura.extract(downloaded)
-        if extracted and len(extracted.strip()) > 30:
-            # For trafilatura, we still do smart extraction from the HTML
-            smart_content = extract_smart_content(downloaded, url)
-            if smart_content:
-                scrape_time = time.time() - scrape_start
-                print(f"    ✓ Success with trafilatura+smart ({scrape_time:.2f}s)")
-                return {"url": url, "method": "trafilatura+smart", "content": smart_content}
+    logger.info(f"    Trying trafilatura...")
+    smart_content = await asyncio.get_running_loop().run_in_executor(_FALLBACK_POOL, _trafilatura_smart, url)
+    if smart_content:
+        scrape_time = time.time() - scrape_start
+        logger.info(f"    ✓ Success with trafilatura+smart ({scrape_time:.2f}s)")
+        return {"url": url, "method": "trafilatura+smart", "content": smart_content}
     
     scrape_time = time.time() - scrape_start
-    print(f"    ✗ Failed to scrape ({scrape_time:.2f}s)")
+    logger.warning(f"    ✗ Failed to scrape ({scrape_time:.2f}s)")
+    return None
+
+async def _first_usable(attempts, urls):
+    """
+    Runs one attempt coroutine per url concurrently and returns the first usable result
+    (the best ranked one on a tie). The remaining attempts are cancelled.
+    """
+    tasks = [asyncio.create_task(attempt) for attempt in attempts]
+    rank = {task: i for i, task in enumerate(tasks)}
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=rank.get):
+                if task.exception():
+                    logger.warning(f"    ✗ Scrape error for {urls[rank[task]]}: {task.exception()}")
+                elif task.result():
+                    return task.result()
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+async def _scrape_first_async(urls):
+    """Scrapes all urls concurrently and returns the first usable result"""
+    timeout = aiohttp.ClientTimeout(total=FETCH_TIMEOUT)
+    connector = aiohttp.TCPConnector(limit_per_host=FETCH_PER_HOST)
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        return await _first_usable([_fetch_and_extract(session, url) for url in urls], urls)
+
+async def _render_and_extract(client, url):
+    """Renders url on RENDER_SERVICE_URL and runs the smart extraction on the resulting HTML"""
+    render_start = time.time()
+    logger.info(f"    Rendering remotely: {url}")
+    try:
+        resp = await client.post(RENDER_SERVICE_URL, json={"url": url})
+        resp.raise_for_status()
+        smart_content = extract_smart_content(_decode_html(resp.content, resp.charset_encoding), url)
+        if smart_content and (smart_content.get("main_content") or smart_content.get("title")):
+            render_time = time.time() - render_start
+            logger.info(f"    ✓ Success with render+smart ({render_time:.2f}s)")
+            return {"url": url, "method": "render+smart", "content": smart_content}
+    except httpx.HTTPError as e:
+        logger.warning(f"    ✗ Render error: {e}")
+    
+    render_time = time.time() - render_start
+    logger.warning(f"    ✗ Render failed ({render_time:.2f}s)")
     return None
 
+async def _render_first_async(urls):
+    """Renders all urls concurrently (multiplexed when HTTP/2 is available) and returns the first usable result"""
+    async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, timeout=RENDER_TIMEOUT) as client:
+        return await _first_usable([_render_and_extract(client, url) for url in urls], urls)
+
+def try_scrape_smart(url):
+    """Try to scrape with smart content extraction"""
+    return asyncio.run(_scrape_first_async([url]))
+
+def _get_browser():
+    """Returns the shared headless Chromium, (re)launching it if it is not running"""
+    global _PLAYWRIGHT, _BROWSER
+    with _BROWSER_LOCK:
+        if _BROWSER is None or not _BROWSER.is_connected():
+            if _PLAYWRIGHT is None:
+                _PLAYWRIGHT = sync_playwright().start()
+                atexit.register(_close_browser)
+            _BROWSER = _PLAYWRIGHT.chromium.launch(headless=True)
+        return _BROWSER
+
+def _close_browser():
+    global _PLAYWRIGHT, _BROWSER
+    with _BROWSER_LOCK:
+        if _BROWSER is not None and _BROWSER.is_connected():
+            _BROWSER.close()
+        if _PLAYWRIGHT is not None:
+            _PLAYWRIGHT.stop()
+        _PLAYWRIGHT = _BROWSER = None
+
+def _block_heavy_resources(route):
+    if route.request.resource_type in _BLOCKED_RESOURCES:
+        route.abort()
+    else:
+        route.continue_()
+
 def try_playwright_scrape_smart(url):
     """Try Playwright with smart content extraction"""
     if not PLAYWRIGHT_AVAILABLE:
-        print(f"    Playwright not installed. Can't scrape JS-heavy site: {url}")
+        logger.warning(f"    Playwright not installed. Can't scrape JS-heavy site: {url}")
         return None
     
     playwright_start = time.time()
-    print(f"    Trying Playwright with smart extraction...")
+    logger.info(f"    Trying Playwright with smart extraction...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    # A fresh context per URL keeps cookies/storage isolated while sharing the browser process
+    context = _get_browser().new_context()
+    context.route("**/*", _block_heavy_resources)
+    try:
+        page = context.new_page()
+        page.goto(url, wait_until="domcontentloaded", timeout=25000)
+        # Give scripts time to render, but only as long as the page is busy; a page that never goes quiet is read as-is
         try:
-            page.goto(url, timeout=25000)
-            time.sleep(2)  # Reduced wait time
-            html = page.content()
-            smart_content = extract_smart_content(html, url)
-            if smart_content and (smart_content.get("main_content") or smart_content.get("title")):
-                playwright_time = time.time() - playwright_start
-                print(f"    ✓ Success with playwright+smart ({playwright_time:.2f}s)")
-                return {"url": url, "method": "playwright+smart", "content": smart_content}
-        except Exception as e:
-            print(f"    ✗ Playwright error: {e}")
-        finally:
-            browser.close()
+            page.wait_for_load_state("networkidle", timeout=5000)
+        except PlaywrightTimeoutError:
+            pass
+        html = page.content()
+        smart_content = extract_smart_content(html, url)
+        if smart_content and (smart_content.get("main_content") or smart_content.get("title")):
+            playwright_time = time.time() - playwright_start
+            logger.info(f"    ✓ Success with playwright+smart ({playwright_time:.2f}s)")
+            return {"url": url, "method": "playwright+smart", "content": smart_content}
+    except Exception as e:
+        logger.warning(f"    ✗ Playwright error: {e}")
+    finally:
+        context.close()
     
     playwright_time = time.time() - playwright_start
-    print(f"    ✗ Playwright failed ({playwright_time:.2f}s)")
+    logger.warning(f"    ✗ Playwright failed ({playwright_time:.2f}s)")
     return None
 
 def scrape_single_site(query, max_search_results=10, use_local_searxng=True):
@@ -524,28 +751,28 @@ def scrape_single_site(query, max_search_results=10, use_local_searxng=True):
     
     # Get search results - try SearXNG first, fallback to DuckDuckGo
     if use_local_searxng:
-        print(f"Searching local SearXNG for: '{query}'")
+        logger.info(f"Searching local SearXNG for: '{query}'")
         search_start = time.time()
         results = scrape_searxng_local(query, max_search_results)
         search_time = time.time() - search_start
         
         if results:
-            print(f"SearXNG search completed in {search_time:.2f}s - Found {len(results)} results")
+            logger.info(f"SearXNG search completed in {search_time:.2f}s - Found {len(results)} results")
         else:
-            print(f"SearXNG search failed, falling back to DuckDuckGo HTML...")
+            logger.warning(f"SearXNG search failed, falling back to DuckDuckGo HTML...")
             search_start = time.time()
             results = scrape_duckduckgo_html(query, max_search_results)
             search_time = time.time() - search_start
-            print(f"DuckDuckGo search completed in {search_time:.2f}s - Found {len(results)} results")
+            logger.info(f"DuckDuckGo search completed in {search_time:.2f}s - Found {len(results)} results")
     else:
-        print(f"Searching DuckDuckGo HTML for: '{query}'")
+        logger.info(f"Searching DuckDuckGo HTML for: '{query}'")
         search_start = time.time()
         results = scrape_duckduckgo_html(query, max_search_results)
         search_time = time.time() - search_start
-        print(f"Search completed in {search_time:.2f}s - Found {len(results)} results")
+        logger.info(f"Search completed in {search_time:.2f}s - Found {len(results)} results")
     
     if not results:
-        print("No search results found")
+        logger.warning("No search results found")
         return None
     
     # Extract URLs from results
@@ -560,39 +787,41 @@ def scrape_single_site(query, max_search_results=10, use_local_searxng=True):
             filtered_urls.append(url)
             seen_domains.add(domain)
     
-    print(f"Filtered to {len(filtered_urls)} unique domains")
+    logger.info(f"Filtered to {len(filtered_urls)} unique domains")
     
     # Try scraping sites until we get one successful result
-    print(f"\nTrying to scrape the best site...")
-    
-    # First try normal scraping on top sites
-    for i, url in enumerate(filtered_urls[:5]):
-        print(f"\nAttempt {i+1}: {url}")
-        scraped = try_scrape_smart(url)
+    logger.info(f"\nTrying to scrape the best site...")
+    
+    # First try normal scraping on the top sites, all at once; the first usable page wins
+    candidates = filtered_urls[:5]
+    logger.info(f"\nScraping {len(candidates)} candidates concurrently...")
+    scraped = asyncio.run(_scrape_first_async(candidates))
+    if scraped:
+        total_time = time.time() - total_start
+        logger.info("\n" + "="*60 + f"\nSUCCESS! Scraped 1 site in {total_time:.2f} seconds\n" + "="*60)
+        return scraped
+    
+    # If normal scraping failed, render the first few with JavaScript: all at once on the
+    # rendering service when one is configured, else one by one in the local Playwright browser
+    if RENDER_SERVICE_URL:
+        logger.info(f"\nRendering failed sites remotely...")
+        scraped = asyncio.run(_render_first_async(filtered_urls[:3]))
         if scraped:
             total_time = time.time() - total_start
-            print(f"\n" + "="*60)
-            print(f"SUCCESS! Scraped 1 site in {total_time:.2f} seconds")
-            print(f"="*60)
+            logger.info("\n" + "="*60 + f"\nSUCCESS! Scraped 1 site in {total_time:.2f} seconds\n" + "="*60)
             return scraped
-    
-    # If normal scraping failed, try Playwright on the first few
-    if PLAYWRIGHT_AVAILABLE:
-        print(f"\nTrying Playwright for failed sites...")
+    elif PLAYWRIGHT_AVAILABLE:
+        logger.info(f"\nTrying Playwright for failed sites...")
         for i, url in enumerate(filtered_urls[:3]):
-            print(f"\nPlaywright attempt {i+1}: {url}")
+            logger.info(f"\nPlaywright attempt {i+1}: {url}")
             scraped = try_playwright_scrape_smart(url)
             if scraped:
                 total_time = time.time() - total_start
-                print(f"\n" + "="*60)
-                print(f"SUCCESS! Scraped 1 site in {total_time:.2f} seconds")
-                print(f"="*60)
+                logger.info("\n" + "="*60 + f"\nSUCCESS! Scraped 1 site in {total_time:.2f} seconds\n" + "="*60)
                 return scraped
     
     total_time = time.time() - total_start
-    print(f"\n" + "="*60)
-    print(f"FAILED to scrape any site in {total_time:.2f} seconds")
-    print(f"="*60)
+    logger.warning("\n" + "="*60 + f"\nFAILED to scrape any site in {total_time:.2f} seconds\n" + "="*60)
     return None
 
 if __name__ == "__main__":
@@ -620,7 +849,12 @@ if __name__ == "__main__":
     print(f"\nStarting execution at {time.strftime('%H:%M:%S')}")
     print("=" * 60)
     
-    result = scrape_single_site(query, use_local_searxng=use_local_searxng)
+    log_listener = _setup_logging()
+    try:
+        result = scrape_single_site(query, use_local_searxng=use_local_searxng)
+    finally:
+        # Writes out every queued progress message before the result is printed
+        log_listener.stop()
     
     execution_time = time.time() - execution_start
     
@@ -3,28 +3,32 @@
 import csv
 import trafilatura
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import urlparse
+from functools import lru_cache
 import time
 import re
 import signal
-from contextlib import contextmanager
 import json
 from datetime import datetime
 import concurrent.futures  # ADD THIS LINE
 import threading
+import asyncio
+import aiohttp
 
 try:
-    from playwright.sync_api import sync_playwright
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
-# Blacklist domains that are known to be slow or problematic
-BLACKLIST_DOMAINS = {
+# Blacklist domains that are known to be slow or problematic (subdomains included)
+BLACKLIST_DOMAINS = frozenset({
     'lenovo.com',
     'daraz.com.bd',
-    'reddit',
+    'reddit.com',
     'mobiledokan.com',
     'oracle.com',
     'salesforce.com',
@@ -38,99 +42,135 @@ BLACKLIST_DOMAINS = {
     'webex.com',
     'gotomeeting.com',
     # Add more problematic domains as needed
+})
+
+# One keep-alive connection pool shared by the search call and every scraper thread,
+# so repeat hosts across phases and bulk queries skip the TCP/TLS handshake
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=Retry(total=1, read=0, backoff_factor=0))
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+
+# Seconds allowed for the TCP/TLS connect; the read timeout is each caller's own budget
+CONNECT_TIMEOUT = 3
+
+SEARXNG_URL = "http://localhost:8888/search"
+_SEARXNG_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Content-Type": "application/x-www-form-urlencoded"
 }
 
-@contextmanager
-def timeout_context(seconds):
-    """Cross-platform timeout context manager using threading"""
-    timeout_occurred = threading.Event()
-    
-    def timeout_handler():
-        time.sleep(seconds)
-        timeout_occurred.set()
-    
-    # Start timeout thread
-    timeout_thread = threading.Thread(target=timeout_handler, daemon=True)
-    timeout_thread.start()
-    
-    try:
-        yield timeout_occurred
-    finally:
-        # Clean up - thread will exit when daemon process ends
-        pass
+# Async batches: at most BATCH_CONCURRENCY pages in flight per batch, over one aiohttp
+# connection pool shared by every phase of a query. trafilatura's blocking fallback
+# runs in its own pool so an abandoned download never holds up asyncio.run.
+BATCH_CONCURRENCY = 10
+_FALLBACK_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=5, thread_name_prefix="trafilatura")
+
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?\s*([\w-]+)', re.IGNORECASE)
 
+# clean_text runs on every extracted fragment, so its patterns are compiled once
+_WS_RE = re.compile(r'\s+')
+_CRUFT_RE = re.compile(r'(cookie|privacy policy|terms of service|subscribe|newsletter)', re.IGNORECASE)
+
+# Important details (prices, specs, features, etc.), labelled by each pattern's first keyword
+_DETAIL_PATTERNS = [
+    r'(?:price|cost|₹|rs\.?|usd|\$)\s*:?\s*([0-9,]+(?:\.[0-9]+)?)',
+    r'(?:mileage|efficiency|mpg|kmpl)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
+    r'(?:power|hp|bhp|kw)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
+    r'(?:engine|displacement|cc)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
+    r'(?:weight|mass|kg|pounds)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
+    r'(?:features?|specifications?|specs?)\s*:?\s*([a-zA-Z0-9\s,.-]+)'
+]
+_DETAIL_RES = [(pattern.split('|')[0].replace('(?:', '').replace('\\', ''), re.compile(pattern, re.IGNORECASE))
+               for pattern in _DETAIL_PATTERNS]
+
+@lru_cache(maxsize=4096)
 def get_domain(url):
     return urlparse(url).netloc.lower().replace('www.', '')
 
 def is_blacklisted(url):
-    """Check if URL domain is in blacklist"""
-    domain = get_domain(url)
-    return any(blacklisted in domain for blacklisted in BLACKLIST_DOMAINS)
+    """Check if URL domain or one of its parent domains is in blacklist"""
+    parts = get_domain(url).partition(':')[0].split('.')
+    return any('.'.join(parts[i:]) in BLACKLIST_DOMAINS for i in range(len(parts)))
+
+def _decode_html(html, charset=None):
+    """lexbor only reads UTF-8, so bytes are decoded with the HTTP charset or the page's <meta charset> first"""
+    if isinstance(html, str):
+        return html
+    if not charset:
+        match = _META_CHARSET_RE.search(html, 0, 4096)
+        charset = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        return html.decode(charset, errors='replace')
+    except LookupError:
+        return html.decode('utf-8', errors='replace')
+
+def _next_element(node):
+    """Next sibling element, skipping text and comment nodes (like bs4's find_next_sibling)"""
+    node = node.next
+    while node is not None and not node.is_element_node:
+        node = node.next
+    return node
 
 def clean_text(text):
     """Clean and normalize text content"""
     if not text:
         return ""
-    # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text.strip())
-    # Remove common web cruft
-    text = re.sub(r'(cookie|privacy policy|terms of service|subscribe|newsletter)', '', text, flags=re.IGNORECASE)
-    return text
+    # Remove extra whitespace and normalize, then common web cruft
+    return _CRUFT_RE.sub('', _WS_RE.sub(' ', text.strip()))
+
+def _parse_searxng_results(search_results, max_results):
+    """Turns a SearXNG JSON response into title/href/body dicts, one per non-blacklisted domain"""
+    if not search_results.get('results'):
+        print("No results found in SearXNG response")
+        return []
+    
+    results = []
+    seen_domains = set()
+    
+    for result in search_results['results']:
+        if len(results) >= max_results:
+            break
+        
+        # Extract URL
+        result_url = result.get('url', '')
+        if not result_url:
+            continue
+            
+        # Skip blacklisted domains
+        if is_blacklisted(result_url):
+            print(f"  Skipping blacklisted domain: {get_domain(result_url)}")
+            continue
+            
+        # Skip duplicate domains
+        domain = get_domain(result_url)
+        if domain in seen_domains:
+            continue
+        seen_domains.add(domain)
+        
+        # Extract other fields
+        title = result.get('title', 'No title available')
+        content = result.get('content', 'No description available')
+        
+        results.append({
+            'title': title,
+            'href': result_url,
+            'body': content
+        })
+        
+    print(f"Found {len(results)} unique results from SearXNG (after filtering blacklist)")
+    return results
 
 def scrape_searxng_local(query, max_results=10):
     """Search using local SearXNG instance"""
-    url = "http://localhost:8888/search"
     data = {"q": query, "format": "json"}
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Content-Type": "application/x-www-form-urlencoded"
-    }
     
     try:
         print(f"Searching SearXNG for: '{query}'")
-        response = requests.post(url, data=data, headers=headers, timeout=15)
+        response = _SESSION.post(SEARXNG_URL, data=data, headers=_SEARXNG_HEADERS, timeout=(CONNECT_TIMEOUT, 15))
         response.raise_for_status()
-        search_results = response.json()
-        
-        if not search_results.get('results'):
-            print("No results found in SearXNG response")
-            return []
-        
-        results = []
-        seen_domains = set()
-        
-        for result in search_results['results']:
-            if len(results) >= max_results:
-                break
-            
-            # Extract URL
-            result_url = result.get('url', '')
-            if not result_url:
-                continue
-                
-            # Skip blacklisted domains
-            if is_blacklisted(result_url):
-                print(f"  Skipping blacklisted domain: {get_domain(result_url)}")
-                continue
-                
-            # Skip duplicate domains
-            domain = get_domain(result_url)
-            if domain in seen_domains:
-                continue
-            seen_domains.add(domain)
-            
-            # Extract other fields
-            title = result.get('title', 'No title available')
-            content = result.get('content', 'No description available')
-            
-            results.append({
-                'title': title,
-                'href': result_url,
-                'body': content
-            })
-            
-        print(f"Found {len(results)} unique results from SearXNG (after filtering blacklist)")
-        return results
+        return _parse_searxng_results(response.json(), max_results)
         
     except requests.exceptions.HTTPError as e:
         print(f"[SearXNG] HTTP error for '{query}': {e}")
@@ -142,9 +182,33 @@ def scrape_searxng_local(query, max_results=10):
         print(f"[SearXNG] Unexpected error for '{query}': {e}")
         return []
 
+async def _scrape_searxng_async(session, query, max_results=10):
+    """Async scrape_searxng_local over the query's shared aiohttp session"""
+    data = {"q": query, "format": "json"}
+    
+    try:
+        print(f"Searching SearXNG for: '{query}'")
+        async with session.post(SEARXNG_URL, data=data, headers=_SEARXNG_HEADERS,
+                                timeout=aiohttp.ClientTimeout(total=15, connect=CONNECT_TIMEOUT)) as response:
+            response.raise_for_status()
+            search_results = await response.json(content_type=None)
+        return _parse_searxng_results(search_results, max_results)
+        
+    except aiohttp.ClientResponseError as e:
+        print(f"[SearXNG] HTTP error for '{query}': {e}")
+        return []
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"[SearXNG] Connection error for '{query}': {e}")
+        return []
+    except Exception as e:
+        print(f"[SearXNG] Unexpected error for '{query}': {e}")
+        return []
+
 def extract_smart_content(html, url):
     """Extract only the most important content based on site type and structure"""
-    soup = BeautifulSoup(html, "lxml")
+    tree = LexborHTMLParser(_decode_html(html))
+    # bs4's get_text() never returned script/style text; lexbor's text() would
+    tree.strip_tags(["script", "style", "template"])
     result = {
         "url": url,
         "domain": get_domain(url),
@@ -155,23 +219,23 @@ def extract_smart_content(html, url):
     }
     
     # Extract title
-    title_tag = soup.find('title')
+    title_tag = tree.css_first('title')
     if title_tag:
-        result["title"] = clean_text(title_tag.get_text())
+        result["title"] = clean_text(title_tag.text())
     
     # Site-specific extraction
     if "amazon." in url:
-        return extract_amazon_smart(soup, url)
+        return extract_amazon_smart(tree, url)
     elif any(domain in url for domain in ["reddit.com", "stackoverflow.com", "github.com"]):
-        return extract_forum_smart(soup, url)
+        return extract_forum_smart(tree, url)
     elif any(domain in url for domain in ["wikipedia.org", "britannica.com"]):
-        return extract_wiki_smart(soup, url)
+        return extract_wiki_smart(tree, url)
     elif any(domain in url for domain in ["youtube.com", "vimeo.com"]):
-        return extract_video_smart(soup, url)
+        return extract_video_smart(tree, url)
     else:
-        return extract_generic_smart(soup, url)
+        return extract_generic_smart(tree, url)
 
-def extract_amazon_smart(soup, url):
+def extract_amazon_smart(tree, url):
     """Extract key Amazon product information"""
     result = {
         "url": url,
@@ -186,9 +250,9 @@ def extract_amazon_smart(soup, url):
     }
     
     # Product title
-    title = soup.find(id="productTitle")
+    title = tree.css_first("#productTitle")
     if title:
-        result["title"] = clean_text(title.get_text())
+        result["title"] = clean_text(title.text())
     
     # Price
     price_selectors = [
@@ -198,44 +262,44 @@ def extract_amazon_smart(soup, url):
         "#priceblock_ourprice"
     ]
     for selector in price_selectors:
-        price = soup.select_one(selector)
+        price = tree.css_first(selector)
         if price:
-            result["price"] = clean_text(price.get_text())
+            result["price"] = clean_text(price.text())
             break
     
     # Rating
-    rating = soup.select_one("[data-hook='average-star-rating'] .a-icon-alt")
+    rating = tree.css_first("[data-hook='average-star-rating'] .a-icon-alt")
     if rating:
-        result["rating"] = clean_text(rating.get_text())
+        result["rating"] = clean_text(rating.text())
     
     # Key features (limit to top 5)
-    bullets = soup.select("#feature-bullets ul li span")
+    bullets = tree.css("#feature-bullets ul li span")
     if bullets:
-        result["key_features"] = [clean_text(b.get_text()) for b in bullets[:5] if clean_text(b.get_text())]
+        result["key_features"] = [clean_text(b.text()) for b in bullets[:5] if clean_text(b.text())]
     
     # Description (first paragraph only)
-    desc = soup.find(id="productDescription")
+    desc = tree.css_first("#productDescription")
     if desc:
-        desc_text = clean_text(desc.get_text())
+        desc_text = clean_text(desc.text())
         # Take only first 500 characters
         result["description"] = desc_text[:500] + "..." if len(desc_text) > 500 else desc_text
     
     # Key specs only (limit to most important ones)
     important_specs = ["Brand", "Model", "Color", "Size", "Weight", "Material", "Dimensions"]
     for table_id in ["productDetails_techSpec_section_1", "productDetails_detailBullets_sections1"]:
-        table = soup.find(id=table_id)
+        table = tree.css_first(f"#{table_id}")
         if table:
-            for row in table.find_all("tr"):
-                th = row.find("th")
-                td = row.find("td")
+            for row in table.css("tr"):
+                th = row.css_first("th")
+                td = row.css_first("td")
                 if th and td:
-                    spec_name = clean_text(th.get_text())
+                    spec_name = clean_text(th.text())
                     if any(imp_spec.lower() in spec_name.lower() for imp_spec in important_specs):
-                        result["specs"][spec_name] = clean_text(td.get_text())
+                        result["specs"][spec_name] = clean_text(td.text())
     
     return result
 
-def extract_forum_smart(soup, url):
+def extract_forum_smart(tree, url):
     """Extract key information from forum/discussion sites"""
     result = {
         "url": url,
@@ -250,31 +314,31 @@ def extract_forum_smart(soup, url):
     # Title
     title_selectors = ["h1", ".title", "[data-testid='post-content'] h1"]
     for selector in title_selectors:
-        title = soup.select_one(selector)
+        title = tree.css_first(selector)
         if title:
-            result["title"] = clean_text(title.get_text())
+            result["title"] = clean_text(title.text())
             break
     
     # Question/main content
     content_selectors = [".post-text", "[data-testid='post-content'] div", ".usertext-body"]
     for selector in content_selectors:
-        content = soup.select_one(selector)
+        content = tree.css_first(selector)
         if content:
-            content_text = clean_text(content.get_text())
+            content_text = clean_text(content.text())
             result["question"] = content_text[:800] + "..." if len(content_text) > 800 else content_text
             break
     
     # Top answers (limit to 2)
     answer_selectors = [".answer .post-text", ".comment-body", ".reply .usertext-body"]
     for selector in answer_selectors:
-        answers = soup.select(selector)
+        answers = tree.css(selector)
         if answers:
-            result["top_answers"] = [clean_text(ans.get_text())[:400] + "..." if len(clean_text(ans.get_text())) > 400 else clean_text(ans.get_text()) for ans in answers[:2]]
+            result["top_answers"] = [clean_text(ans.text())[:400] + "..." if len(clean_text(ans.text())) > 400 else clean_text(ans.text()) for ans in answers[:2]]
             break
     
     return result
 
-def extract_wiki_smart(soup, url):
+def extract_wiki_smart(tree, url):
     """Extract key information from Wikipedia-style sites"""
     result = {
         "url": url,
@@ -286,26 +350,26 @@ def extract_wiki_smart(soup, url):
     }
     
     # Title
-    title = soup.find('h1')
+    title = tree.css_first('h1')
     if title:
-        result["title"] = clean_text(title.get_text())
+        result["title"] = clean_text(title.text())
     
     # Summary (first paragraph)
-    first_p = soup.select_one("p")
+    first_p = tree.css_first("p")
     if first_p:
-        summary_text = clean_text(first_p.get_text())
+        summary_text = clean_text(first_p.text())
         result["summary"] = summary_text[:600] + "..." if len(summary_text) > 600 else summary_text
     
     # Key sections (first 3 h2 sections)
-    sections = soup.select("h2")
+    sections = tree.css("h2")
     for section in sections[:3]:
-        section_title = clean_text(section.get_text())
+        section_title = clean_text(section.text())
         if section_title and not any(skip in section_title.lower() for skip in ["reference", "external", "see also"]):
             result["key_sections"].append(section_title)
     
     return result
 
-def extract_video_smart(soup, url):
+def extract_video_smart(tree, url):
     """Extract key information from video sites"""
     result = {
         "url": url,
@@ -320,23 +384,23 @@ def extract_video_smart(soup, url):
     # Title
     title_selectors = ["h1", ".title", "[name='title']"]
     for selector in title_selectors:
-        title = soup.select_one(selector)
+        title = tree.css_first(selector)
         if title:
-            result["title"] = clean_text(title.get_text())
+            result["title"] = clean_text(title.text())
             break
     
     # Description (first 300 chars)
     desc_selectors = [".description", "[name='description']", ".content"]
     for selector in desc_selectors:
-        desc = soup.select_one(selector)
+        desc = tree.css_first(selector)
         if desc:
-            desc_text = clean_text(desc.get_text())
+            desc_text = clean_text(desc.text())
             result["description"] = desc_text[:300] + "..." if len(desc_text) > 300 else desc_text
             break
     
     return result
 
-def extract_generic_smart(soup, url):
+def extract_generic_smart(tree, url):
     """Extract key information from generic websites"""
     result = {
         "url": url,
@@ -350,14 +414,14 @@ def extract_generic_smart(soup, url):
     }
     
     # Title
-    title = soup.find('title')
+    title = tree.css_first('title')
     if title:
-        result["title"] = clean_text(title.get_text())
+        result["title"] = clean_text(title.text())
     
     # Try to get a summary from meta description
-    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    meta_desc = tree.css_first("meta[name='description']")
     if meta_desc:
-        result["summary"] = clean_text(meta_desc.get('content', ''))
+        result["summary"] = clean_text(meta_desc.attributes.get('content') or '')
     
     # Main content areas (prioritize article, main, or content divs)
     content_selectors = [
@@ -368,9 +432,9 @@ def extract_generic_smart(soup, url):
     
     main_content_found = False
     for selector in content_selectors:
-        content = soup.select_one(selector)
+        content = tree.css_first(selector)
         if content:
-            content_text = clean_text(content.get_text())
+            content_text = clean_text(content.text())
             if len(content_text) > 100:  # Ensure substantial content
                 # Limit to first 1500 characters for more comprehensive info
                 result["main_content"] = content_text[:1500] + "..." if len(content_text) > 1500 else content_text
@@ -379,16 +443,16 @@ def extract_generic_smart(soup, url):
     
     # If no main content found, get body content but filter out navigation/footer
     if not main_content_found:
-        # Remove navigation, footer, sidebar elements
-        for unwanted in soup.select('nav, footer, aside, .nav, .footer, .sidebar, .menu, .header, .advertisement, .ads'):
+        # Remove navigation, footer, sidebar elements (innermost first: lexbor frees a node's whole subtree)
+        for unwanted in reversed(tree.css('nav, footer, aside, .nav, .footer, .sidebar, .menu, .header, .advertisement, .ads')):
             unwanted.decompose()
         
         # Get all paragraphs and list items
-        content_elements = soup.select("p, li, div.description, div.summary, .info, .details")
+        content_elements = tree.css("p, li, div.description, div.summary, .info, .details")
         content_texts = []
         
         for elem in content_elements:
-            text = clean_text(elem.get_text())
+            text = clean_text(elem.text())
             if len(text) > 20 and not any(skip in text.lower() for skip in 
                 ['cookie', 'privacy', 'terms', 'subscribe', 'newsletter', 'login', 'register']):
                 content_texts.append(text)
@@ -398,20 +462,20 @@ def extract_generic_smart(soup, url):
             result["main_content"] = combined_text[:1500] + "..." if len(combined_text) > 1500 else combined_text
     
     # Extract key sections with their content
-    headings = soup.select("h1, h2, h3")
+    headings = tree.css("h1, h2, h3")
     for heading in headings[:6]:  # Top 6 headings
-        heading_text = clean_text(heading.get_text())
+        heading_text = clean_text(heading.text())
         if heading_text and len(heading_text) > 3:
             # Find content after this heading
             section_content = []
-            current = heading.find_next_sibling()
+            current = _next_element(heading)
             
-            while current and current.name not in ['h1', 'h2', 'h3'] and len(section_content) < 3:
-                if current.name in ['p', 'div', 'ul', 'ol']:
-                    text = clean_text(current.get_text())
+            while current and current.tag not in ['h1', 'h2', 'h3'] and len(section_content) < 3:
+                if current.tag in ['p', 'div', 'ul', 'ol']:
+                    text = clean_text(current.text())
                     if len(text) > 20:
                         section_content.append(text)
-                current = current.find_next_sibling()
+                current = _next_element(current)
             
             if section_content:
                 section_text = " ".join(section_content)
@@ -425,33 +489,23 @@ def extract_generic_smart(soup, url):
                 })
     
     # Extract important details (prices, specs, features, etc.)
-    detail_patterns = [
-        r'(?:price|cost|₹|rs\.?|usd|\$)\s*:?\s*([0-9,]+(?:\.[0-9]+)?)',
-        r'(?:mileage|efficiency|mpg|kmpl)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
-        r'(?:power|hp|bhp|kw)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
-        r'(?:engine|displacement|cc)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
-        r'(?:weight|mass|kg|pounds)\s*:?\s*([0-9]+(?:\.[0-9]+)?)',
-        r'(?:features?|specifications?|specs?)\s*:?\s*([a-zA-Z0-9\s,.-]+)'
-    ]
-    
     full_text = result["main_content"] + " " + " ".join([section["content"] for section in result["key_sections"]])
     
-    for pattern in detail_patterns:
-        matches = re.findall(pattern, full_text, re.IGNORECASE)
-        if matches:
-            detail_type = pattern.split('|')[0].replace('(?:', '').replace('\\', '')
-            result["important_details"].append(f"{detail_type}: {matches[0]}")
+    for detail_type, pattern in _DETAIL_RES:
+        match = pattern.search(full_text)
+        if match:
+            result["important_details"].append(f"{detail_type}: {match.group(1)}")
     
     # If we still don't have good content, try table data
     if len(result["main_content"]) < 200:
-        tables = soup.select("table")
+        tables = tree.css("table")
         table_data = []
         for table in tables[:2]:  # Max 2 tables
-            rows = table.select("tr")
+            rows = table.css("tr")
             for row in rows[:5]:  # Max 5 rows per table
-                cells = row.select("td, th")
+                cells = row.css("td, th")
                 if len(cells) >= 2:
-                    row_text = " | ".join([clean_text(cell.get_text()) for cell in cells])
+                    row_text = " | ".join([clean_text(cell.text()) for cell in cells])
                     if len(row_text) > 10:
                         table_data.append(row_text)
         
@@ -465,50 +519,33 @@ def try_scrape_smart(url, timeout_seconds=8):
     scrape_start = time.time()
     print(f"  Attempting to scrape: {url} (timeout: {timeout_seconds}s)")
     
+    # Try requests + smart extraction first; the socket timeouts bound the request itself
+    print(f"    Trying requests + smart extraction...")
     try:
-        with timeout_context(timeout_seconds) as timeout_event:
-            # Try requests + smart extraction first
-            print(f"    Trying requests + smart extraction...")
-            try:
-                if timeout_event.is_set():
-                    raise TimeoutError(f"Operation timed out after {timeout_seconds} seconds")
-                
-                resp = requests.get(url, timeout=timeout_seconds, headers={"User-Agent": "Mozilla/5.0"})
-                if resp.ok:
-                    if timeout_event.is_set():
-                        raise TimeoutError(f"Operation timed out after {timeout_seconds} seconds")
-                    
-                    smart_content = extract_smart_content(resp.text, url)
-                    if smart_content and (smart_content.get("main_content") or smart_content.get("key_sections")):
-                        scrape_time = time.time() - scrape_start
-                        print(f"    ✓ Success with requests+smart ({scrape_time:.2f}s)")
-                        return {"url": url, "method": "requests+smart", "content": smart_content}
-            except requests.exceptions.RequestException as e:
-                print(f"    ✗ Requests failed: {e}")
-            
-            # Try trafilatura as fallback
-            print(f"    Trying trafilatura...")
-            if timeout_event.is_set():
-                raise TimeoutError(f"Operation timed out after {timeout_seconds} seconds")
-            
-            downloaded = trafilatura.fetch_url(url)
-            if downloaded:
-                if timeout_event.is_set():
-                    raise TimeoutError(f"Operation timed out after {timeout_seconds} seconds")
-                
-                extracted = trafilatura.extract(downloaded)
-                if extracted and len(extracted.strip()) > 30:
-                    # For trafilatura, we still do smart extraction from the HTML
-                    smart_content = extract_smart_content(downloaded, url)
-                    if smart_content:
-                        scrape_time = time.time() - scrape_start
-                        print(f"    ✓ Success with trafilatura+smart ({scrape_time:.2f}s)")
-                        return {"url": url, "method": "trafilatura+smart", "content": smart_content}
-    
-    except TimeoutError:
-        scrape_time = time.time() - scrape_start
-        print(f"    ✗ Timeout after {scrape_time:.2f}s")
-        return None
+        resp = _SESSION.get(url, timeout=(CONNECT_TIMEOUT, timeout_seconds - CONNECT_TIMEOUT))
+        if resp.ok:
+            # Decoded once here; requests' resp.text would run charset detection over the whole body
+            charset = resp.encoding if 'charset' in resp.headers.get('Content-Type', '').lower() else None
+            smart_content = extract_smart_content(_decode_html(resp.content, charset), url)
+            if smart_content and (smart_content.get("main_content") or smart_content.get("key_sections")):
+                scrape_time = time.time() - scrape_start
+                print(f"    ✓ Success with requests+smart ({scrape_time:.2f}s)")
+                return {"url": url, "method": "requests+smart", "content": smart_content}
+    except requests.exceptions.RequestException as e:
+        print(f"    ✗ Requests failed: {e}")
+    
+    # Try trafilatura as fallback
+    print(f"    Trying trafilatura...")
+    downloaded = trafilatura.fetch_url(url)
+    if downloaded:
+        extracted = trafilatura.extract(downloaded)
+        if extracted and len(extracted.strip()) > 30:
+            # For trafilatura, we still do smart extraction from the HTML
+            smart_content = extract_smart_content(downloaded, url)
+            if smart_content:
+                scrape_time = time.time() - scrape_start
+                print(f"    ✓ Success with trafilatura+smart ({scrape_time:.2f}s)")
+                return {"url": url, "method": "trafilatura+smart", "content": smart_content}
     
     scrape_time = time.time() - scrape_start
     print(f"    ✗ Failed to scrape ({scrape_time:.2f}s)")
@@ -523,36 +560,29 @@ def try_playwright_scrape_smart(url, timeout_seconds=15):
     playwright_start = time.time()
     print(f"    Trying Playwright with smart extraction... (timeout: {timeout_seconds}s)")
     
-    try:
-        with timeout_context(timeout_seconds) as timeout_event:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                try:
-                    if timeout_event.is_set():
-                        raise TimeoutError(f"Operation timed out after {timeout_seconds} seconds")
-                    
-                    page.goto(url, timeout=timeout_seconds * 1000)
-                    time.sleep(2)  # Wait for dynamic content
-                    
-                    if timeout_event.is_set():
-                        raise TimeoutError(f"Operation timed out after {timeout_seconds} seconds")
-                    
-                    html = page.content()
-                    smart_content = extract_smart_content(html, url)
-                    if smart_content and (smart_content.get("main_content") or smart_content.get("title")):
-                        playwright_time = time.time() - playwright_start
-                        print(f"    ✓ Success with playwright+smart ({playwright_time:.2f}s)")
-                        return {"url": url, "method": "playwright+smart", "content": smart_content}
-                except Exception as e:
-                    print(f"    ✗ Playwright error: {e}")
-                finally:
-                    browser.close()
-    
-    except TimeoutError:
-        playwright_time = time.time() - playwright_start
-        print(f"    ✗ Playwright timeout after {playwright_time:.2f}s")
-        return None
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        # Every Playwright wait (navigation, content) gives up on its own after timeout_seconds
+        page.set_default_timeout(timeout_seconds * 1000)
+        try:
+            page.goto(url, timeout=timeout_seconds * 1000)
+            time.sleep(2)  # Wait for dynamic content
+            
+            html = page.content()
+            smart_content = extract_smart_content(html, url)
+            if smart_content and (smart_content.get("main_content") or smart_content.get("title")):
+                playwright_time = time.time() - playwright_start
+                print(f"    ✓ Success with playwright+smart ({playwright_time:.2f}s)")
+                return {"url": url, "method": "playwright+smart", "content": smart_content}
+        except PlaywrightTimeoutError:
+            playwright_time = time.time() - playwright_start
+            print(f"    ✗ Playwright timeout after {playwright_time:.2f}s")
+            return None
+        except Exception as e:
+            print(f"    ✗ Playwright error: {e}")
+        finally:
+            browser.close()
     
     playwright_time = time.time() - playwright_start
     print(f"    ✗ Playwright failed ({playwright_time:.2f}s)")
@@ -758,16 +788,13 @@ def try_scrape_smart_with_better_timeout(
         if stop_event and stop_event.is_set():
             return None
 
-        resp = requests.get(
-            url,
-            timeout=hard_timeout - 1,
-            headers={"User-Agent": "Mozilla/5.0"}
-        )
+        resp = _SESSION.get(url, timeout=(CONNECT_TIMEOUT, hard_timeout - 1))
         if stop_event and stop_event.is_set():
             return None
 
         if resp.ok:
-            smart = extract_smart_content(resp.text, url)
+            charset = resp.encoding if 'charset' in resp.headers.get('Content-Type', '').lower() else None
+            smart = extract_smart_content(_decode_html(resp.content, charset), url)
             if smart and (smart.get("main_content") or smart.get("key_sections")):
                 print(f"    ✓ {domain} completed in {time.time()-start_time:.2f}s")
                 return {"url": url, "method": "requests+smart", "content": smart}
@@ -792,6 +819,80 @@ def try_scrape_smart_with_better_timeout(
 
     return None
 
+async def _scrape_smart_async(session, url, timeout_seconds=6):
+    """Async try_scrape_smart_with_better_timeout; cancelling the task stops the download itself."""
+    start_time = time.time()
+    domain = get_domain(url)
+    print(f"    Starting {domain}")
+
+    try:
+        # ---------- first attempt: aiohttp ----------
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout_seconds - 1, connect=CONNECT_TIMEOUT)) as resp:
+            if resp.ok:
+                smart = extract_smart_content(_decode_html(await resp.read(), resp.charset), url)
+                if smart and (smart.get("main_content") or smart.get("key_sections")):
+                    print(f"    ✓ {domain} completed in {time.time()-start_time:.2f}s")
+                    return {"url": url, "method": "aiohttp+smart", "content": smart}
+
+        # ---------- fallback: trafilatura ----------
+        remaining = timeout_seconds - (time.time() - start_time)
+        if remaining > 2:
+            loop = asyncio.get_running_loop()
+            downloaded = await loop.run_in_executor(_FALLBACK_POOL, trafilatura.fetch_url, url)
+            if downloaded:
+                smart = extract_smart_content(downloaded, url)
+                if smart:
+                    print(f"    ✓ {domain} trafilatura in {time.time()-start_time:.2f}s")
+                    return {"url": url, "method": "trafilatura+smart", "content": smart}
+
+    except Exception as e:
+        print(f"    ✗ {domain} error: {str(e)[:40]}")
+
+    return None
+
+async def _scrape_batch_async(session, urls, timeout_per_site=6, batch_name="Batch", max_sites_needed=2):
+    """
+    Scrapes a batch concurrently and returns as soon as max_sites_needed succeed or
+    timeout_per_site runs out; whatever is still in flight is cancelled.
+    """
+    print(f"  {batch_name}: {len(urls)} sites • {timeout_per_site}s each")
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def scrape(url):
+        async with semaphore:
+            return await _scrape_smart_async(session, url, timeout_per_site)
+
+    successful = []
+    pending = {asyncio.create_task(scrape(url)) for url in urls}
+    deadline = time.monotonic() + timeout_per_site
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, timeout=max(0, deadline - time.monotonic()),
+                                               return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break  # batch deadline
+            for task in done:
+                res = task.result()
+                if res:
+                    successful.append(res)
+                    print(f"  ✓ {get_domain(res['url'])} "
+                          f"({len(successful)}/{max_sites_needed})")
+                    if len(successful) >= max_sites_needed:
+                        # -------- EARLY SUCCESS --------
+                        return successful
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    return successful
+
+def _make_connector():
+    return aiohttp.TCPConnector(limit=64, limit_per_host=4, ttl_dns_cache=300)
+
+def _make_client_session():
+    return aiohttp.ClientSession(connector=_make_connector(), headers={"User-Agent": "Mozilla/5.0"})
+
 # def scrape_batch_parallel(
 #     urls,
 #     timeout_per_site: int = 6,          # ← 6 s instead of 15 s
@@ -864,47 +965,11 @@ def scrape_batch_parallel(
     batch_name: str = "Batch",
     max_sites_needed: int = 2,
 ):
-    print(f"  {batch_name}: {len(urls)} sites • {timeout_per_site}s each")
-    stop_event = threading.Event()                 # <‑‑ FLAG
-
-    successful, batch_start = [], time.time()
-    executor = concurrent.futures.ThreadPoolExecutor(
-        max_workers=min(len(urls), 5), thread_name_prefix="scraper"
-    )
-    fut_to_url = {
-        executor.submit(
-            try_scrape_smart_with_better_timeout,
-            url,
-            timeout_per_site,
-            stop_event,                            # <‑‑ PASS FLAG
-        ): url for url in urls
-    }
-
-    try:
-        deadline = batch_start + timeout_per_site
-        while fut_to_url and time.time() < deadline:
-            done, _ = concurrent.futures.wait(
-                fut_to_url.keys(),
-                timeout=0.25,
-                return_when=concurrent.futures.FIRST_COMPLETED,
-            )
-            for fut in done:
-                url = fut_to_url.pop(fut)
-                res = fut.result()
-                if res:
-                    successful.append(res)
-                    print(f"  ✓ {get_domain(url)} "
-                          f"({len(successful)}/{max_sites_needed})")
-                    if len(successful) >= max_sites_needed:
-                        # -------- EARLY SUCCESS --------
-                        stop_event.set()           # <‑‑ TELL OTHERS TO STOP
-                        executor.shutdown(wait=False, cancel_futures=True)
-                        return successful
-        # time‑out / no more futures
-    finally:
-        executor.shutdown(wait=False, cancel_futures=True)
-
-    return successful
+    """Sync entry point for a single batch (with its own aiohttp session)"""
+    async def run():
+        async with _make_client_session() as session:
+            return await _scrape_batch_async(session, urls, timeout_per_site, batch_name, max_sites_needed)
+    return asyncio.run(run())
 
 
 def scrape_batch_playwright(urls, timeout_per_site=10, batch_name="Playwright Batch", max_sites_needed=2):
@@ -964,14 +1029,14 @@ def scrape_batch_playwright(urls, timeout_per_site=10, batch_name="Playwright Ba
     print(f"  {batch_name} completed: {len(successful_scrapes)}/{len(urls)} sites in {elapsed:.2f}s")
     return successful_scrapes
 
-def scrape_multiple_sites_truly_parallel(query, max_sites=2, max_total_time=60, max_search_results=15):
+async def _scrape_multiple_sites_async(session, query, max_sites=2, max_total_time=60, max_search_results=15):
     """Enhanced parallel scraping with immediate early termination"""
     total_start = time.time()
     
     # Get search results from SearXNG
     print(f"Searching local SearXNG for: '{query}'")
     search_start = time.time()
-    results = scrape_searxng_local(query, max_search_results)
+    results = await _scrape_searxng_async(session, query, max_search_results)
     search_time = time.time() - search_start
     
     if not results:
@@ -996,7 +1061,7 @@ def scrape_multiple_sites_truly_parallel(query, max_sites=2, max_total_time=60,
     print(f"\n=== PHASE 1: First 8 sites (15 seconds max) ===")
     batch_1_urls = filtered_urls[:8]
     if batch_1_urls:
-        batch_results = scrape_batch_parallel(batch_1_urls, timeout_per_site=15, batch_name="Batch 1", max_sites_needed=max_sites)
+        batch_results = await _scrape_batch_async(session, batch_1_urls, timeout_per_site=15, batch_name="Batch 1", max_sites_needed=max_sites)
         successful_scrapes.extend(batch_results)
         
         if len(successful_scrapes) >= max_sites:
@@ -1011,7 +1076,7 @@ def scrape_multiple_sites_truly_parallel(query, max_sites=2, max_total_time=60,
         
         batch_2_urls = filtered_urls[8:13]
         if batch_2_urls:
-            batch_results = scrape_batch_parallel(batch_2_urls, timeout_per_site=12, batch_name="Batch 2", max_sites_needed=max_sites - len(successful_scrapes))
+            batch_results = await _scrape_batch_async(session, batch_2_urls, timeout_per_site=12, batch_name="Batch 2", max_sites_needed=max_sites - len(successful_scrapes))
             successful_scrapes.extend(batch_results)
             
             if len(successful_scrapes) >= max_sites:
@@ -1029,7 +1094,7 @@ def scrape_multiple_sites_truly_parallel(query, max_sites=2, max_total_time=60,
                           if get_domain(url) not in successful_domains][:5]
         
         if playwright_urls:
-            batch_results = scrape_batch_playwright(playwright_urls, timeout_per_site=20, batch_name="Playwright Batch", max_sites_needed=max_sites - len(successful_scrapes))
+            batch_results = await asyncio.to_thread(scrape_batch_playwright, playwright_urls, timeout_per_site=20, batch_name="Playwright Batch", max_sites_needed=max_sites - len(successful_scrapes))
             successful_scrapes.extend(batch_results)
     
     # Return results
@@ -1048,6 +1113,13 @@ def scrape_multiple_sites_truly_parallel(query, max_sites=2, max_total_time=60,
         print(f"="*60)
         return None
 
+def scrape_multiple_sites_truly_parallel(query, max_sites=2, max_total_time=60, max_search_results=15):
+    """Runs every phase of a query on one event loop and one aiohttp connection pool"""
+    async def run():
+        async with _make_client_session() as session:
+            return await _scrape_multiple_sites_async(session, query, max_sites, max_total_time, max_search_results)
+    return asyncio.run(run())
+
 # Update the main function to use the truly parallel version
 def scrape_multiple_sites_parallel(query, max_sites=2, max_total_time=60, max_search_results=15):
     """